@@ -10,4 +10,5 @@ urlpatterns = [
     path('admin/users/', views.admin_users, name='admin_users'),
     path('admin/resumes/', views.admin_resumes, name='admin_resumes'),
     path('admin/api-keys/', views.admin_api_keys, name='admin_api_keys'),
+    path('admin/job-cache-stats/', views.admin_job_cache_stats, name='admin_job_cache_stats'),
 ]
@@ -5,9 +5,12 @@ from django.contrib import messages
 from django.contrib.auth.models import User
 from django.views.decorators.http import require_http_methods
 from django.db.models import Count
+from django.http import JsonResponse
 
 from accounts.forms import UserRegistrationForm, UserLoginForm
 from main.models import Resume, APIKey
+from main.job_api import page_fetches
+from main.job_cache import page_cache_stats
 
 # Admin views
 @login_required(login_url='login')
@@ -104,3 +107,17 @@ def admin_api_keys(request):
     }
     
     return render(request, 'admin/api_keys.html', context)
+
+
+@login_required(login_url='login')
+@require_http_methods(["GET"])
+def admin_job_cache_stats(request):
+    """Admin: Job search cache and request coalescing statistics"""
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'message': 'Permission denied'}, status=403)
+    
+    return JsonResponse({
+        'success': True,
+        'cache': page_cache_stats.get_stats(),
+        'coalescing': page_fetches.get_stats(),
+    })
@@ -85,6 +85,16 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -128,6 +138,45 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Keep uploads up to the 5MB resume limit in memory instead of /tmp
+FILE_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024
+
+# Share of resume parses that record per-stage timings, and whether those
+# sampled parses also trace memory (slow, keep off in production)
+RESUME_PARSE_METRICS_SAMPLE_RATE = 0.1
+RESUME_PARSE_METRICS_TRACK_MEMORY = False
+
+# Read PDFs of 20+ pages with a process pool, and accept up to 200 pages
+# instead of 30; worth it on hosts with spare cores
+RESUME_PARSE_PARALLEL_PAGES = False
+
+# Parsed uploads kept for re-uploads of the same file: the least recently
+# used are evicted past the entry limit, and any unused for the timeout
+# (seconds) expire, since they hold personal details
+RESUME_PARSE_CACHE_MAX_ENTRIES = 500
+RESUME_PARSE_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+
+# JSearch rate limit: sustained requests per second and allowed burst
+JSEARCH_REQUESTS_PER_SECOND = 2
+JSEARCH_BURST = 3
+
+# JSearch search endpoint; set JSEARCH_BASE_URL to use the local stand-in
+# server in benchmarks/jsearch_standin.py instead of RapidAPI
+JSEARCH_BASE_URL = os.environ.get('JSEARCH_BASE_URL', 'https://jsearch.p.rapidapi.com/search')
+
+# JSearch result cache: seconds until a page is refreshed in the background,
+# until it must be refetched, and how long after that a stale copy may still
+# be served when the API fails
+JSEARCH_CACHE_SOFT_TTL = 6 * 60 * 60
+JSEARCH_CACHE_HARD_TTL = 24 * 60 * 60
+JSEARCH_CACHE_STALE_TTL = 3 * 24 * 60 * 60
+
+# Seconds a job in the local JobResult index is served without the API
+JSEARCH_INDEX_MAX_AGE = 24 * 60 * 60
+
+# Seconds a resume's ranked recommendations are reused across pages
+JSEARCH_RECOMMENDATION_TTL = 15 * 60
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -136,3 +185,22 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Login URL
 LOGIN_URL = 'login'
 LOGIN_REDIRECT_URL = 'dashboard'
+
+
+# Logging
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'main': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+    },
+}
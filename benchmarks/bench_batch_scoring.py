@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Batch Scoring Benchmark
+Scores every synthetic resume against every synthetic job with BatchScorer,
+and compares it with the per-pair substring scorer and the per-resume
+RankedJobs BM25 ranking, both timed on a sample and extrapolated
+
+Usage: python benchmarks/bench_batch_scoring.py [--resumes 5000] [--jobs 100000] [--memory-mb 256]
+"""
+import argparse
+import math
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / 'benchmarks'))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+import django
+django.setup()
+
+from main.batch_scoring import BatchScorer
+from main.job_api import JobRecommendationEngine
+from main.ranking import RankedJobs
+from main.skill_index import extract_job_terms
+from job_corpus import generate_jobs, generate_resume_skills
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--resumes', type=int, default=5000)
+    arg_parser.add_argument('--jobs', type=int, default=100000)
+    arg_parser.add_argument('--top-k', type=int, default=20)
+    arg_parser.add_argument('--memory-mb', type=int, default=256)
+    arg_parser.add_argument('--sample', type=int, default=3, help='Resumes timed with the slower scorers')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    print(f"Generating {args.jobs:,} jobs and {args.resumes:,} resumes...")
+    jobs = generate_jobs(args.jobs, args.seed)
+    for job in jobs:
+        job.update(extract_job_terms(job))
+    resumes = generate_resume_skills(args.resumes, args.seed)
+
+    start = time.perf_counter()
+    scorer = BatchScorer.from_jobs(jobs, memory_budget=args.memory_mb * 1024 ** 2)
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ranked_lists = list(scorer.top_k(resumes, k=args.top_k))
+    batch_time = time.perf_counter() - start
+
+    # Per-pair and per-resume scorers on a sample
+    sample = resumes[:args.sample]
+    engine = JobRecommendationEngine()
+    start = time.perf_counter()
+    for resume_skills in sample:
+        for job in jobs:
+            engine._calculate_match_score(job, resume_skills)
+    pair_time = (time.perf_counter() - start) / len(sample) * args.resumes
+
+    # BatchScorer relevance is float32, so compare with a tolerance
+    mismatches = 0
+    start = time.perf_counter()
+    for resume_skills, ranked in zip(sample, ranked_lists):
+        entries = RankedJobs(jobs, resume_skills, stats=scorer.ranker.stats).entries(args.top_k)
+        expected = [relevance for _, relevance, _ in entries]
+        actual = [relevance for _, relevance in ranked]
+        mismatches += len(expected) != len(actual) or not all(
+            math.isclose(a, b, rel_tol=1e-4) for a, b in zip(expected, actual)
+        )
+    ranked_time = (time.perf_counter() - start) / len(sample) * args.resumes
+
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print("=" * 64)
+    print("BATCH SCORING BENCHMARK")
+    print("=" * 64)
+    print(f"Resumes x jobs:          {args.resumes:,} x {args.jobs:,}")
+    print(f"Memory budget:           {args.memory_mb} MB, {scorer.chunk_rows():,} resumes per chunk")
+    print(f"Job matrix encode:       {encode_time:.2f} s ({scorer.weights.nbytes / 1024 ** 2:.1f} MB)")
+    print(f"BatchScorer top-{args.top_k}:       {batch_time:.2f} s "
+          f"({args.resumes * args.jobs / batch_time / 1e6:.0f}M pairs/s)")
+    print(f"RankedJobs (estimated):  {ranked_time:.1f} s")
+    print(f"Per-pair (estimated):    {pair_time:.1f} s")
+    print(f"Peak RSS:                {peak_rss_mb:.0f} MB")
+    print(f"Top-K score mismatches:  {mismatches} of {len(sample)} sampled resumes vs RankedJobs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+HTTP Connection Reuse Benchmark
+Compares a new connection per request (plain requests.get) with the pooled
+keep-alive session used by JobSearchAPI, against a local stand-in server
+or any URL given with --url. Also checks that throttled responses are
+retried.
+
+Jobs from the throttling check are indexed in a temporary SQLite
+database, so the project database is left untouched.
+
+Usage: python benchmarks/bench_http_session.py [--requests 200] [--url https://...]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+from django.conf import settings
+
+DATABASE_DIR = tempfile.TemporaryDirectory()
+settings.DATABASES['default']['NAME'] = str(Path(DATABASE_DIR.name) / 'http_session.sqlite3')
+
+import django
+django.setup()
+
+import requests
+from django.core.cache import cache
+from django.core.management import call_command
+
+from main.job_api import JobSearchAPI, get_session
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON endpoint that throttles every fifth request"""
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without this, Nagle's
+    # algorithm and delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+    request_count = 0
+    lock = threading.Lock()
+    
+    def do_GET(self):
+        with self.lock:
+            StandInHandler.request_count += 1
+            throttled = self.path.startswith('/throttled') and StandInHandler.request_count % 5 == 0
+        
+        if throttled:
+            body = b'{"message": "Too many requests"}'
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+        else:
+            body = json.dumps({'data': [{'job_id': 'standin_1', 'job_title': 'Python Developer'}]}).encode()
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def time_requests(get, url, count):
+    """Return per-request latencies in seconds"""
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        get(url, timeout=10).content
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--requests', type=int, default=200)
+    arg_parser.add_argument('--url', help='Endpoint to measure instead of the local stand-in')
+    args = arg_parser.parse_args()
+    call_command('migrate', verbosity=0)
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    url = args.url or f"{base_url}/search"
+    
+    fresh = time_requests(requests.get, url, args.requests)
+    pooled = time_requests(get_session().get, url, args.requests)
+    
+    print("=" * 60)
+    print(f"CONNECTION REUSE BENCHMARK ({args.requests} requests to {url})")
+    print("=" * 60)
+    print(f"New connection per request: mean {statistics.mean(fresh) * 1000:.2f} ms, "
+          f"p50 {statistics.median(fresh) * 1000:.2f} ms")
+    print(f"Pooled keep-alive session:  mean {statistics.mean(pooled) * 1000:.2f} ms, "
+          f"p50 {statistics.median(pooled) * 1000:.2f} ms")
+    print(f"Saved per request:          {(statistics.mean(fresh) - statistics.mean(pooled)) * 1000:.2f} ms")
+    
+    # Every fifth stand-in response is a 429 with Retry-After: 0
+    JobSearchAPI.BASE_URL = f"{base_url}/throttled"
+    cache.clear()
+    api = JobSearchAPI('benchmark')
+    jobs = api.search_jobs('python', num_pages=10)
+    ok = all(job['job_id'] == 'standin_1' for job in jobs)
+    print(f"Retry check: {len(jobs)} jobs from 10 pages with throttling - {'OK' if ok else 'FAILED'}")
+    
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
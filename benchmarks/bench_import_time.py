@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Import-time Benchmark
+Measures how long a fresh process takes to import the resume views and to
+load the spaCy model, comparing the old eager full-pipeline load with the
+lazy trimmed one. Each measurement runs in its own interpreter.
+
+Usage: python benchmarks/bench_import_time.py [--repeat 3]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SETUP = f"""
+import os, sys, time, json
+sys.path.insert(0, {str(BASE_DIR)!r})
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+import django
+django.setup()
+"""
+
+SCENARIOS = {
+    # What every worker and management command paid before: spaCy and NLTK
+    # imported and the full pipeline loaded while importing main.services
+    'eager full load (before)': """
+start = time.perf_counter()
+import spacy, nltk
+from nltk.corpus import stopwords
+spacy.load("en_core_web_sm")
+import main.views
+print(json.dumps({'seconds': time.perf_counter() - start}))
+""",
+    'import main.views (after)': """
+start = time.perf_counter()
+import main.views
+print(json.dumps({'seconds': time.perf_counter() - start}))
+""",
+    'first parse model load (after)': """
+import main.services
+start = time.perf_counter()
+main.services.get_nlp()
+print(json.dumps({'seconds': time.perf_counter() - start}))
+""",
+}
+
+
+def run_scenario(code):
+    """Run one scenario in a fresh interpreter and return seconds or an error"""
+    result = subprocess.run(
+        [sys.executable, '-c', SETUP + code],
+        capture_output=True, text=True, cwd=BASE_DIR
+    )
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1]
+    return json.loads(result.stdout.strip().splitlines()[-1])['seconds'], None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+    
+    print("=" * 60)
+    print("IMPORT TIME BENCHMARK")
+    print("=" * 60)
+    
+    for name, code in SCENARIOS.items():
+        timings = []
+        error = None
+        for _ in range(args.repeat):
+            seconds, error = run_scenario(code)
+            if error:
+                break
+            timings.append(seconds)
+        
+        if error:
+            print(f"{name:<34} FAILED: {error}")
+        else:
+            print(f"{name:<34} {min(timings) * 1000:8.1f} ms (best of {args.repeat})")
+
+
+if __name__ == '__main__':
+    main()
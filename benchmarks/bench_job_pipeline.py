@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Job Pipeline Benchmark
+Runs resume recommendations end to end against the local JSearch stand-in,
+through the page fetch, page cache, local job index and BM25 ranking,
+first with cold caches and then warm, and reports latency percentiles,
+cache outcomes and upstream responses by status
+
+Jobs are indexed in a temporary SQLite database, so the project database
+is left untouched. Pass --url to use a stand-in started separately with
+benchmarks/jsearch_standin.py instead of one in this process.
+
+Usage: python benchmarks/bench_job_pipeline.py [--resumes 50] [--corpus 20000] [--latency-ms 300]
+    [--rate-429 0.05] [--rate-5xx 0.02]
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / 'benchmarks'))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+from django.conf import settings
+
+DATABASE_DIR = tempfile.TemporaryDirectory()
+settings.DATABASES['default']['NAME'] = str(Path(DATABASE_DIR.name) / 'pipeline.sqlite3')
+
+import django
+django.setup()
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.paginator import Paginator
+
+from main.job_api import JobSearchAPI, get_recommended_jobs, page_fetches
+from main.job_cache import page_cache_stats
+from main.models import JobResult
+from job_corpus import generate_resume_skills
+from jsearch_standin import LATENCY_DISTRIBUTIONS, FaultInjector, JobCorpus, start_server
+
+
+def run_pass(resumes, pages):
+    """Return per-resume latencies in seconds for the first page of recommendations"""
+    latencies = []
+    for resume_skills in resumes:
+        start = time.perf_counter()
+        list(Paginator(get_recommended_jobs(resume_skills, 'benchmark', pages=pages), 10).get_page(1))
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summary(latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    return f"p50 {statistics.median(latencies) * 1000:8.1f} ms   p95 {p95 * 1000:8.1f} ms"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--resumes', type=int, default=50)
+    arg_parser.add_argument('--pages', type=int, default=2, help='Pages fetched per recommendation')
+    arg_parser.add_argument('--corpus', type=int, default=20000, help='Stand-in corpus size')
+    arg_parser.add_argument('--latency', choices=LATENCY_DISTRIBUTIONS, default='lognormal')
+    arg_parser.add_argument('--latency-ms', type=float, default=300)
+    arg_parser.add_argument('--rate-429', type=float, default=0.0)
+    arg_parser.add_argument('--rate-5xx', type=float, default=0.0)
+    arg_parser.add_argument('--requests-per-second', type=float, default=50,
+                            help='Client rate limit, in place of JSEARCH_REQUESTS_PER_SECOND')
+    arg_parser.add_argument('--url', help='Search endpoint of an already running stand-in')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    settings.JSEARCH_REQUESTS_PER_SECOND = args.requests_per_second
+    settings.JSEARCH_BURST = max(1, int(args.requests_per_second))
+    call_command('migrate', verbosity=0)
+    cache.clear()
+    # Per-fetch info and retry warnings would drown the report
+    logging.disable(logging.WARNING)
+
+    server = None
+    if args.url:
+        JobSearchAPI.BASE_URL = args.url
+    else:
+        print(f"Indexing a {args.corpus:,} job stand-in corpus...")
+        faults = FaultInjector(args.latency, args.latency_ms, rate_429=args.rate_429, rate_5xx=args.rate_5xx,
+                               retry_after=0, seed=args.seed)
+        server = start_server(JobCorpus(args.corpus, args.seed), faults)
+        JobSearchAPI.BASE_URL = server.url
+
+    resumes = generate_resume_skills(args.resumes, args.seed)
+    cold = run_pass(resumes, args.pages)
+    warm = run_pass(resumes, args.pages)
+
+    print("=" * 64)
+    print("JOB PIPELINE BENCHMARK")
+    print("=" * 64)
+    print(f"Endpoint:          {JobSearchAPI.BASE_URL}")
+    if server:
+        print(f"Stand-in:          {args.latency} latency around {args.latency_ms:.0f} ms, "
+              f"{args.rate_429:.0%} 429s, {args.rate_5xx:.0%} 5xx")
+    print(f"Resumes:           {args.resumes} x {args.pages} page(s)")
+    print(f"Cold caches:       {summary(cold)}")
+    print(f"Warm caches:       {summary(warm)}")
+    print(f"Jobs indexed:      {JobResult.objects.count():,}")
+    print(f"Page cache:        {page_cache_stats.get_stats()}")
+    print(f"Upstream fetches:  {page_fetches.get_stats()}")
+    if server:
+        print(f"Stand-in statuses: {dict(sorted(server.statuses.items()))}")
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
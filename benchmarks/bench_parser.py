@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+Resume Parser Benchmark
+Parses a synthetic PDF/DOCX corpus end to end and per stage, and reports
+throughput, p50/p95 latency and peak RSS as JSON. With --compare, flags
+cases that got slower than a stored baseline.
+
+Usage:
+    python benchmarks/bench_parser.py --output baseline.json
+    python benchmarks/bench_parser.py --compare baseline.json [--threshold 0.2]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / 'benchmarks'))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+import django
+django.setup()
+
+from main.services import ResumeParser, get_nlp
+from resume_corpus import generate_corpus
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak / 1024 ** 2 if platform.system() == 'Darwin' else peak / 1024
+
+
+def run_benchmark(docs_per_case, seed):
+    """Parse every corpus document and collect per-case statistics"""
+    parser = ResumeParser(metrics_sample_rate=1.0)
+
+    # Load the model up front so the first case does not pay for it
+    get_nlp()
+
+    latencies = defaultdict(list)
+    stages = defaultdict(lambda: defaultdict(list))
+
+    for file_type, size, density, index, file_bytes in generate_corpus(docs_per_case, seed):
+        case = f"{file_type}/{size}/{density}"
+
+        start = time.perf_counter()
+        parsed_data = parser.parse_resume(file_bytes, file_type=file_type)
+        latencies[case].append(time.perf_counter() - start)
+
+        if not parsed_data:
+            raise RuntimeError(f"Failed to parse {case} #{index}")
+        for stage, entry in parsed_data['parse_metrics'].items():
+            stages[case][stage].append(entry['seconds'])
+
+    cases = {}
+    for case, timings in latencies.items():
+        cases[case] = {
+            'docs': len(timings),
+            'throughput_per_sec': len(timings) / sum(timings),
+            'p50_ms': percentile(timings, 0.50) * 1000,
+            'p95_ms': percentile(timings, 0.95) * 1000,
+            'stages_p50_ms': {
+                stage: percentile(values, 0.50) * 1000 for stage, values in stages[case].items()
+            },
+        }
+
+    return {
+        'python': platform.python_version(),
+        'docs_per_case': docs_per_case,
+        'seed': seed,
+        'peak_rss_mb': peak_rss_mb(),
+        'cases': cases,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return a list of regression messages for cases slower than the baseline"""
+    regressions = []
+    for case, current in results['cases'].items():
+        previous = baseline['cases'].get(case)
+        if not previous:
+            continue
+        for metric in ('p50_ms', 'p95_ms'):
+            if current[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    f"{case} {metric}: {previous[metric]:.2f} -> {current[metric]:.2f} ms "
+                    f"(+{(current[metric] / previous[metric] - 1) * 100:.0f}%)"
+                )
+
+    if results['peak_rss_mb'] > baseline['peak_rss_mb'] * (1 + threshold):
+        regressions.append(
+            f"peak_rss_mb: {baseline['peak_rss_mb']:.1f} -> {results['peak_rss_mb']:.1f} MB"
+        )
+    return regressions
+
+
+def print_report(results):
+    print("=" * 72)
+    print("RESUME PARSER BENCHMARK")
+    print("=" * 72)
+    print(f"{'Case':<22} {'Docs':>5} {'Docs/s':>9} {'p50 ms':>9} {'p95 ms':>9}  Slowest stage")
+    for case, stats in sorted(results['cases'].items()):
+        slowest = max(stats['stages_p50_ms'].items(), key=lambda item: item[1])
+        print(f"{case:<22} {stats['docs']:>5} {stats['throughput_per_sec']:>9.1f} "
+              f"{stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f}  {slowest[0]} ({slowest[1]:.2f} ms)")
+    print(f"\nPeak RSS: {results['peak_rss_mb']:.1f} MB")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--docs', type=int, default=20, help='Documents per format/size/density case')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--output', help='Write results as JSON to this file')
+    arg_parser.add_argument('--compare', help='Baseline JSON file to compare against')
+    arg_parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed slowdown before a case is flagged (0.2 = 20%%)')
+    args = arg_parser.parse_args()
+
+    results = run_benchmark(args.docs, args.seed)
+    print_report(results)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS against {args.compare}:")
+            for message in regressions:
+                print(f"  ✗ {message}")
+            sys.exit(1)
+        print(f"\n✓ No regressions against {args.compare}")
+
+
+if __name__ == '__main__':
+    main()
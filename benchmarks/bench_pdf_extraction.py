@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+PDF Extraction Benchmark
+Compares serial and parallel page extraction on synthetic 10-, 50- and
+200-page PDFs
+
+Usage: python benchmarks/bench_pdf_extraction.py [--pages 10 50 200] [--workers 4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / 'benchmarks'))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+import django
+django.setup()
+
+from main.services import ResumeParser, get_page_pool
+from synthetic_pdf import build_pdf
+
+LINES_PER_PAGE = 55
+PAGE_LINE = "Developed Python and Django services on AWS with Docker, PostgreSQL and Redis at Example Corp"
+
+
+def best_of(func, repeat):
+    """Return the best wall time of several runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--pages', type=int, nargs='+', default=[10, 50, 200])
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count())
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+    
+    max_pages = max(args.pages)
+    serial = ResumeParser(max_pages=max_pages, max_chars=10 ** 9)
+    parallel = ResumeParser(max_pages=max_pages, max_chars=10 ** 9, parallel_pages=True, n_workers=args.workers)
+    
+    # Start the worker processes before timing anything
+    list(get_page_pool(args.workers).map(abs, range(args.workers)))
+    
+    print("=" * 60)
+    print(f"PDF EXTRACTION BENCHMARK ({args.workers} workers, parallel above "
+          f"{ResumeParser.PARALLEL_PAGE_THRESHOLD} pages)")
+    print("=" * 60)
+    print(f"{'Pages':>6} {'Serial':>12} {'Parallel':>12} {'Speedup':>9}")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for page_count in args.pages:
+            pages = [[f"Page {number + 1}"] + [PAGE_LINE] * LINES_PER_PAGE for number in range(page_count)]
+            file_path = Path(tmp_dir) / f"resume_{page_count}.pdf"
+            file_path.write_bytes(build_pdf(pages))
+            
+            if serial.extract_text_from_pdf(file_path) != parallel.extract_text_from_pdf(file_path):
+                print(f"{page_count:>6} text mismatch between serial and parallel extraction")
+                continue
+            
+            serial_time = best_of(lambda: serial.extract_text_from_pdf(file_path), args.repeat)
+            parallel_time = best_of(lambda: parallel.extract_text_from_pdf(file_path), args.repeat)
+            print(f"{page_count:>6} {serial_time * 1000:>9.1f} ms {parallel_time * 1000:>9.1f} ms "
+                  f"{serial_time / parallel_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Ranking Evaluation
+Compares the BM25 ranker with the original substring scorer on synthetic
+jobs whose core and incidental skills are known, reporting NDCG@10,
+precision@10 and ranking latency per resume
+
+A job's graded relevance to a resume is twice the proficiency weight of
+each shared core skill plus half the weight of each shared incidental
+skill. A job counts as relevant for precision if it shares a core skill.
+
+Usage: python benchmarks/eval_ranking.py [--jobs 2000] [--resumes 200]
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / 'benchmarks'))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+import django
+django.setup()
+
+from main.job_api import JobRecommendationEngine
+from main.ranking import CorpusStats
+from main.reverse_match import proficiency_weight
+from main.skill_index import extract_job_terms
+from job_corpus import generate_labeled_jobs, generate_resume_skills
+
+CUTOFF = 10
+
+
+def gain(job, weights):
+    core = sum(2 * weights[skill] for skill in job['core_skills'] if skill in weights)
+    incidental = sum(0.5 * weights[skill] for skill in job['incidental_skills'] if skill in weights)
+    return core + incidental
+
+
+def ndcg(ranked_gains, all_gains):
+    dcg = sum(value / math.log2(rank + 2) for rank, value in enumerate(ranked_gains[:CUTOFF]))
+    ideal = sorted(all_gains, reverse=True)[:CUTOFF]
+    idcg = sum(value / math.log2(rank + 2) for rank, value in enumerate(ideal))
+    return dcg / idcg if idcg else 0.0
+
+
+def substring_rank(engine, jobs, resume_skills):
+    """The original recommend_jobs scoring and sort"""
+    scored = []
+    for job in jobs:
+        score, _ = engine._calculate_match_score(job, resume_skills)
+        if score > 0:
+            scored.append((score, job))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [job for _, job in scored]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--jobs', type=int, default=2000, help='Candidate jobs per resume')
+    arg_parser.add_argument('--resumes', type=int, default=200)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    jobs = generate_labeled_jobs(args.jobs, args.seed)
+    # Term statistics are extracted once at ingest
+    for job in jobs:
+        job.update(extract_job_terms(job))
+    resumes = generate_resume_skills(args.resumes, args.seed)
+
+    engine = JobRecommendationEngine()
+    stats = CorpusStats.from_jobs(jobs)
+    results = {'substring': {'ndcg': [], 'precision': [], 'ms': []}, 'bm25': {'ndcg': [], 'precision': [], 'ms': []}}
+
+    for resume_skills in resumes:
+        weights = {skill['name'].lower(): proficiency_weight(skill['proficiency']) for skill in resume_skills}
+        all_gains = [gain(job, weights) for job in jobs]
+
+        for name in results:
+            start = time.perf_counter()
+            if name == 'substring':
+                ranked = substring_rank(engine, jobs, resume_skills)
+            else:
+                ranked = engine.rank_jobs(jobs, resume_skills, stats=stats)
+            results[name]['ms'].append((time.perf_counter() - start) * 1000)
+
+            top = ranked[:CUTOFF]
+            results[name]['ndcg'].append(ndcg([gain(job, weights) for job in top], all_gains))
+            relevant = sum(1 for job in top if any(skill in weights for skill in job['core_skills']))
+            results[name]['precision'].append(relevant / CUTOFF)
+
+    print("=" * 68)
+    print("RANKING EVALUATION")
+    print("=" * 68)
+    print(f"Candidate jobs: {args.jobs:,}   Resumes: {args.resumes}")
+    print(f"{'Scorer':<12} {'NDCG@10':>9} {'P@10':>7} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, values in results.items():
+        latencies = sorted(values['ms'])
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+        print(f"{name:<12} {statistics.mean(values['ndcg']):>9.3f} {statistics.mean(values['precision']):>7.3f} "
+              f"{statistics.median(latencies):>9.2f} {p95:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Synthetic Job Corpus
+Generates deterministic job dicts in the JobSearchAPI result shape, and
+matching resume skill lists, for benchmarks only
+"""
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main.services import ResumeParser
+
+SKILLS = [skill for skill_list in ResumeParser.COMMON_SKILLS.values() for skill in skill_list]
+
+ROLES = ['Developer', 'Engineer', 'Architect', 'Consultant', 'Analyst', 'Lead']
+LEVELS = ['Junior', 'Senior', 'Staff', 'Principal', '']
+COMPANIES = ['Infosys', 'Tata Consultancy Services', 'Wipro', 'Flipkart', 'Zoho', 'Freshworks', 'Swiggy',
+             'Razorpay', 'Zerodha', 'PhonePe']
+CITIES = ['Bangalore', 'Mumbai', 'Hyderabad', 'Pune', 'Chennai', 'Delhi', 'Kochi']
+JOB_TYPES = ['FULLTIME', 'PARTTIME', 'CONTRACTOR', 'INTERN']
+FILLER = (
+    'we are hiring an experienced engineer to build reliable products for our customers with a '
+    'collaborative team that values ownership quality and learning across the platform roadmap'
+).split()
+
+
+def generate_job(rng, index, skills_per_job=(3, 10), words=(60, 140)):
+    """Build one synthetic job dict"""
+    job_skills = rng.sample(SKILLS, rng.randint(*skills_per_job))
+    title_skill = job_skills[0].title() if rng.random() < 0.7 else ''
+    title = ' '.join(part for part in (rng.choice(LEVELS), title_skill, rng.choice(ROLES)) if part)
+
+    words_list = [rng.choice(FILLER) for _ in range(rng.randint(*words))]
+    for skill in job_skills:
+        words_list.insert(rng.randrange(len(words_list) + 1), skill)
+    description = ' '.join(words_list).capitalize() + '.'
+
+    city = rng.choice(CITIES)
+    return {
+        'job_id': f'synthetic_{index:07d}',
+        'title': title,
+        'company': rng.choice(COMPANIES),
+        'location': f'{city}, India',
+        'salary': f'INR {rng.randint(4, 40) * 100000:,}',
+        'job_type': rng.choice(JOB_TYPES),
+        'description': description,
+        'apply_link': f'https://jobs.example.com/{index}',
+        'posted_date': f'2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00Z',
+    }
+
+
+def generate_jobs(count, seed=0, start=0):
+    """Return jobs start..start+count-1; the same seed gives the same jobs"""
+    return [generate_job(random.Random(f"{seed}-{index}"), index) for index in range(start, start + count)]
+
+
+def generate_labeled_job(rng, index):
+    """
+    Build a job with known core and incidental skills
+
+    Core skills are the job's real requirements: one is in the title and
+    each is mentioned several times. Incidental skills are mentioned once,
+    as nice-to-haves.
+    """
+    sampled = rng.sample(SKILLS, rng.randint(3, 7))
+    core, incidental = sampled[:rng.randint(1, 3)], sampled[3:]
+    title = ' '.join(part for part in (rng.choice(LEVELS), core[0].title(), rng.choice(ROLES)) if part)
+
+    words_list = [rng.choice(FILLER) for _ in range(rng.randint(40, 220))]
+    for skill in core:
+        for _ in range(rng.randint(2, 4)):
+            words_list.insert(rng.randrange(len(words_list) + 1), skill)
+    for skill in incidental:
+        words_list.insert(rng.randrange(len(words_list) + 1), skill)
+
+    return {
+        'job_id': f'labeled_{index:07d}',
+        'title': title,
+        'company': rng.choice(COMPANIES),
+        'location': f'{rng.choice(CITIES)}, India',
+        'job_type': rng.choice(JOB_TYPES),
+        'description': ' '.join(words_list).capitalize() + '.',
+        'core_skills': core,
+        'incidental_skills': incidental,
+    }
+
+
+def generate_labeled_jobs(count, seed=0):
+    """Return jobs with core_skills and incidental_skills labels"""
+    return [generate_labeled_job(random.Random(f"labeled-{seed}-{index}"), index) for index in range(count)]
+
+
+def generate_resume_skills(count, seed=0, skills_per_resume=(4, 12)):
+    """Return resume skill lists in the Resume.skills shape"""
+    resumes = []
+    for index in range(count):
+        rng = random.Random(f"resume-{seed}-{index}")
+        resumes.append([
+            {
+                'name': skill.upper(),
+                'category': ResumeParser.SKILL_MATCHER.categories[skill],
+                'proficiency': rng.choice(['Beginner', 'Intermediate', 'Advanced']),
+            }
+            for skill in rng.sample(SKILLS, rng.randint(*skills_per_resume))
+        ])
+    return resumes
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+"""
+Local JSearch Stand-in Server
+Serves the JSearch /search contract from a large deterministic synthetic
+job corpus, with configurable response latency and injected 429 and 5xx
+errors, so the fetch, cache and scoring path can be load tested offline
+
+Each OR-separated alternative in the query matches jobs whose title or
+description contains all of its words; an empty query matches every job.
+The location parameter keeps jobs whose location contains it. Results are
+in corpus order and paginated by page and num_pages, 10 jobs per page.
+Other JSearch parameters, such as country and date_posted, are accepted
+and ignored.
+
+Usage:
+    python benchmarks/jsearch_standin.py [--port 8765] [--jobs 20000] [--latency lognormal]
+        [--latency-ms 300] [--rate-429 0.05] [--rate-5xx 0.02]
+    JSEARCH_BASE_URL=http://127.0.0.1:8765/search python manage.py runserver
+"""
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / 'benchmarks'))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_resume_screening.settings')
+import django
+django.setup()
+
+from main.job_cache import QUERY_SEPARATOR
+from job_corpus import CITIES, generate_jobs
+
+PAGE_SIZE = 10
+MAX_NUM_PAGES = 20
+
+LATENCY_DISTRIBUTIONS = ('fixed', 'uniform', 'exponential', 'lognormal')
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#./-]+')
+
+
+def tokens(text):
+    """Lowercase words of a text, without trailing punctuation"""
+    return {token.strip('.') for token in TOKEN_PATTERN.findall(text.lower())} - {''}
+
+
+def to_jsearch(job):
+    """Convert a synthetic job dict into a JSearch result object"""
+    salary = int(re.sub(r'\D', '', job['salary']) or 0)
+    return {
+        'job_id': job['job_id'],
+        'job_title': job['title'],
+        'employer_name': job['company'],
+        'job_location': job['location'],
+        'job_city': job['location'].split(',')[0],
+        'job_country': 'IN',
+        'job_employment_type': job['job_type'],
+        'job_description': job['description'],
+        'job_apply_link': job['apply_link'],
+        'job_posted_at_datetime_utc': job['posted_date'],
+        'job_min_salary': salary or None,
+        'job_max_salary': None,
+        'job_salary_currency': 'INR',
+    }
+
+
+class JobCorpus:
+    """
+    Word index over synthetic jobs
+
+    Only the postings and each job's city are kept in memory. Jobs are
+    generated again from their position when a page is served, which
+    gives the same job every time for the same seed.
+    """
+
+    def __init__(self, size, seed=0, batch_size=5000):
+        self.size = size
+        self.seed = seed
+        self.postings = defaultdict(list)
+        self.cities = []
+
+        for start in range(0, size, batch_size):
+            for position, job in enumerate(generate_jobs(min(batch_size, size - start), seed, start), start):
+                for token in tokens(f"{job['title']} {job['description']}"):
+                    self.postings[token].append(position)
+                self.cities.append(CITIES.index(job['location'].split(',')[0]))
+
+        self.matching = lru_cache(maxsize=1024)(self._matching)
+
+    def _matching(self, query, location):
+        """Corpus positions matching a query and location, in corpus order"""
+        alternatives = [tokens(alternative) for alternative in query.split(QUERY_SEPARATOR)]
+        alternatives = [words for words in alternatives if words]
+
+        if alternatives:
+            positions = set()
+            for words in alternatives:
+                lists = sorted((self.postings.get(word, []) for word in words), key=len)
+                matched = set(lists[0]).intersection(*lists[1:])
+                positions |= matched
+            positions = sorted(positions)
+        else:
+            positions = range(self.size)
+
+        location = location.strip().lower()
+        if location:
+            cities = {index for index, city in enumerate(CITIES) if location in f'{city}, india'.lower()}
+            positions = [position for position in positions if self.cities[position] in cities]
+        return positions
+
+    def search(self, query, location='', page=1, num_pages=1):
+        """JSearch result objects for the requested pages"""
+        positions = self.matching(query, location)
+        start = (page - 1) * PAGE_SIZE
+        window = positions[start:start + num_pages * PAGE_SIZE]
+        return [to_jsearch(generate_jobs(1, self.seed, position)[0]) for position in window]
+
+
+class FaultInjector:
+    """Draws response latencies and injected errors from a seeded RNG"""
+
+    def __init__(self, latency='fixed', latency_ms=0.0, sigma=0.5, rate_429=0.0, rate_5xx=0.0,
+                 retry_after=1, seed=0):
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {latency}")
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.sigma = sigma
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def delay(self):
+        """Seconds to wait before responding; latency_ms is the mean, or the median for lognormal"""
+        with self.lock:
+            if self.latency == 'uniform':
+                ms = self.rng.uniform(0, 2 * self.latency_ms)
+            elif self.latency == 'exponential':
+                ms = self.rng.expovariate(1 / self.latency_ms) if self.latency_ms else 0.0
+            elif self.latency == 'lognormal':
+                ms = self.rng.lognormvariate(math.log(self.latency_ms), self.sigma) if self.latency_ms else 0.0
+            else:
+                ms = self.latency_ms
+        return ms / 1000
+
+    def error_status(self):
+        """Status code of an injected error, or None to respond normally"""
+        with self.lock:
+            draw = self.rng.random()
+            if draw < self.rate_429:
+                return 429
+            if draw < self.rate_429 + self.rate_5xx:
+                return self.rng.choice((500, 502, 503))
+        return None
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """JSearch /search endpoint over the server's corpus"""
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without this, Nagle's
+    # algorithm and delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.rstrip('/') != '/search':
+            self.send_json(404, {'message': 'Endpoint does not exist'})
+            return
+
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        try:
+            page = max(1, int(params.get('page', 1)))
+            num_pages = min(MAX_NUM_PAGES, max(1, int(params.get('num_pages', 1))))
+        except ValueError:
+            self.send_json(400, {'message': 'page and num_pages must be integers'})
+            return
+
+        server = self.server
+        time.sleep(server.faults.delay())
+
+        status = server.faults.error_status()
+        if status == 429:
+            self.send_json(429, {'message': 'You have exceeded the rate limit per second for your plan'},
+                           {'Retry-After': str(server.faults.retry_after)})
+        elif status:
+            self.send_json(status, {'message': 'Injected upstream error'})
+        else:
+            query = params.get('query', '')
+            self.send_json(200, {
+                'status': 'OK',
+                'request_id': f'standin-{server.request_count()}',
+                'parameters': {'query': query, 'page': page, 'num_pages': num_pages},
+                'data': server.corpus.search(query, params.get('location', ''), page, num_pages),
+            })
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record(status)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand-in server that counts responses by status code"""
+    daemon_threads = True
+
+    def __init__(self, address, corpus, faults):
+        super().__init__(address, StandInHandler)
+        self.corpus = corpus
+        self.faults = faults
+        self.statuses = Counter()
+        self.stats_lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def record(self, status):
+        with self.stats_lock:
+            self.statuses[status] += 1
+
+    def request_count(self):
+        with self.stats_lock:
+            return sum(self.statuses.values())
+
+
+def start_server(corpus, faults=None, host='127.0.0.1', port=0):
+    """Serve in a background thread and return the server; its url is the /search endpoint"""
+    server = StandInServer((host, port), corpus, faults or FaultInjector())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8765)
+    arg_parser.add_argument('--jobs', type=int, default=20000, help='Corpus size')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--latency', choices=LATENCY_DISTRIBUTIONS, default='lognormal')
+    arg_parser.add_argument('--latency-ms', type=float, default=300,
+                            help='Mean latency, or the median for lognormal')
+    arg_parser.add_argument('--latency-sigma', type=float, default=0.5, help='Lognormal shape')
+    arg_parser.add_argument('--rate-429', type=float, default=0.0, help='Share of requests throttled')
+    arg_parser.add_argument('--rate-5xx', type=float, default=0.0, help='Share of requests failing with 5xx')
+    arg_parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with 429s')
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    corpus = JobCorpus(args.jobs, args.seed)
+    print(f"Indexed {args.jobs:,} synthetic jobs in {time.perf_counter() - start:.1f}s")
+
+    faults = FaultInjector(args.latency, args.latency_ms, args.latency_sigma, args.rate_429, args.rate_5xx,
+                           args.retry_after, args.seed)
+    server = StandInServer((args.host, args.port), corpus, faults)
+    print(f"Serving JSearch stand-in on {server.url} (Ctrl-C to stop)")
+    print(f"Point the app at it with JSEARCH_BASE_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Responses by status: {dict(sorted(server.statuses.items()))}")
+
+
+if __name__ == '__main__':
+    main()
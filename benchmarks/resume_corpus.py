@@ -0,0 +1,120 @@
+"""
+Synthetic Resume Corpus
+Generates deterministic resumes as PDF and DOCX bytes at several sizes
+and skill densities, for benchmarks only
+"""
+import io
+import random
+import sys
+from pathlib import Path
+
+from docx import Document
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main.services import ResumeParser
+from synthetic_pdf import build_pdf
+
+# Number of experience entries and filler sentences per entry
+SIZES = {
+    'small': (2, 3),
+    'medium': (5, 6),
+    'large': (15, 10),
+}
+
+# Share of filler words replaced by a known skill
+DENSITIES = {
+    'low': 0.02,
+    'high': 0.15,
+}
+
+FIRST_NAMES = ['Aarav', 'Priya', 'Rahul', 'Ananya', 'Vikram', 'Meera', 'Arjun', 'Kavya']
+LAST_NAMES = ['Sharma', 'Iyer', 'Patel', 'Reddy', 'Nair', 'Gupta', 'Menon', 'Rao']
+COMPANIES = ['Infosys', 'Tata Consultancy Services', 'Wipro', 'Flipkart', 'Zoho', 'Freshworks', 'Swiggy']
+TITLES = ['Software Engineer', 'Senior Developer', 'Data Analyst', 'DevOps Engineer', 'Tech Lead']
+FILLER = (
+    'designed maintained delivered improved scalable services customers team reliable platform '
+    'features performance release migration pipeline reporting dashboards stakeholders'
+).split()
+
+LINE_WIDTH = 90
+
+
+def _sentence(rng, skills, density, words=14):
+    chosen = [rng.choice(skills) if rng.random() < density else rng.choice(FILLER) for _ in range(words)]
+    return ' '.join(chosen).capitalize() + '.'
+
+
+def _wrap(text):
+    """Wrap text into lines short enough for one PDF line"""
+    lines, line = [], ''
+    for word in text.split():
+        if line and len(line) + len(word) + 1 > LINE_WIDTH:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}".strip()
+    if line:
+        lines.append(line)
+    return lines
+
+
+def resume_lines(size, density, seed):
+    """Build the text lines of one synthetic resume"""
+    rng = random.Random(seed)
+    skills = [skill for skill_list in ResumeParser.COMMON_SKILLS.values() for skill in skill_list]
+    entries, sentences = SIZES[size]
+    skill_density = DENSITIES[density]
+
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@example.com | +91 98{rng.randint(10000000, 99999999)}",
+        '',
+        'Summary',
+    ]
+    lines += _wrap(' '.join(_sentence(rng, skills, skill_density) for _ in range(3)))
+
+    lines += ['', 'Experience']
+    for _ in range(entries):
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)} ({rng.randint(2012, 2024)})")
+        lines += _wrap(' '.join(_sentence(rng, skills, skill_density) for _ in range(sentences)))
+
+    lines += ['', 'Education', 'Bachelor of Technology in Computer Science, Anna University.', '']
+    lines += ['Projects']
+    for _ in range(max(1, entries // 2)):
+        lines += _wrap('Built ' + _sentence(rng, skills, skill_density).lower())
+
+    lines += ['', 'Certifications', 'AWS Certified Solutions Architect', '', 'Skills']
+    lines += _wrap(', '.join(rng.sample(skills, 12)))
+    return lines
+
+
+def build_docx(lines):
+    """Render resume lines as DOCX bytes"""
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_resume_pdf(lines, lines_per_page=55):
+    """Render resume lines as PDF bytes"""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    return build_pdf(pages)
+
+
+def generate_corpus(docs_per_case, seed=0):
+    """
+    Yield (file_type, size, density, index, file_bytes) for every case
+
+    The same seed always produces the same corpus.
+    """
+    for size in SIZES:
+        for density in DENSITIES:
+            for index in range(docs_per_case):
+                lines = resume_lines(size, density, seed=f"{seed}-{size}-{density}-{index}")
+                yield 'pdf', size, density, index, build_resume_pdf(lines)
+                yield 'docx', size, density, index, build_docx(lines)
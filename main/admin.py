@@ -1,5 +1,5 @@
 from django.contrib import admin
-from main.models import Resume, Skill, JobResult, SavedJob, APIKey
+from main.models import Resume, Skill, JobResult, SavedJob, APIKey, ResumeParseJob
 
 
 @admin.register(Resume)
@@ -19,10 +19,10 @@ class SkillAdmin(admin.ModelAdmin):
 
 @admin.register(JobResult)
 class JobResultAdmin(admin.ModelAdmin):
-    list_display = ('title', 'company', 'location', 'match_score', 'fetched_at')
+    list_display = ('title', 'company', 'location', 'fetched_at', 'updated_at', 'last_seen_at')
     search_fields = ('title', 'company')
     list_filter = ('fetched_at', 'job_type')
-    readonly_fields = ('fetched_at',)
+    readonly_fields = ('fetched_at', 'updated_at', 'last_seen_at', 'content_hash')
 
 
 @admin.register(SavedJob)
@@ -38,3 +38,12 @@ class APIKeyAdmin(admin.ModelAdmin):
     list_display = ('api_name', 'is_active', 'updated_at')
     list_filter = ('is_active', 'updated_at')
     readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(ResumeParseJob)
+class ResumeParseJobAdmin(admin.ModelAdmin):
+    list_display = ('user', 'file_name', 'status', 'created_at', 'finished_at')
+    search_fields = ('user__username', 'file_name')
+    list_filter = ('status', 'created_at')
+    exclude = ('file_data',)
+    readonly_fields = ('created_at', 'started_at', 'finished_at')
@@ -0,0 +1,121 @@
+"""
+Batch Job Scoring
+Scores many resumes against many jobs at once with NumPy matrix products,
+returning the top-K jobs per resume within a bounded memory budget
+"""
+import logging
+
+import numpy as np
+
+from main.ranking import BM25Ranker, CorpusStats
+from main.services import ResumeParser
+from main.skill_index import job_terms
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 ** 2
+
+# Bytes per job column held for each resume row of a chunk: float32 scores
+# plus the int64 indices returned by argpartition
+BYTES_PER_SCORE = 4 + 8
+
+
+class BatchScorer:
+    """
+    Scores resumes against a fixed set of jobs in chunks
+
+    Jobs are encoded once as a skills x jobs matrix of BM25 term weights,
+    with the title boost and length normalization of BM25Ranker, and each
+    resume as a row of proficiency weights, so a resume row times that
+    matrix is the BM25Ranker relevance of every job. The skill vocabulary is
+    the parser taxonomy, which is small enough that dense float32 matrices
+    are both smaller and faster than sparse ones. Memory is bounded by
+    scoring only as many resumes at a time as fit in the budget.
+    """
+
+    def __init__(self, job_term_lists, stats=None, vocabulary=None, memory_budget=DEFAULT_MEMORY_BUDGET):
+        """
+        Args:
+            job_term_lists: Term statistics per job, see job_terms
+            stats: CorpusStats for IDF and average length, defaults to those of the jobs
+            vocabulary: Skill names to encode, defaults to the parser taxonomy
+            memory_budget: Approximate bytes to use while scoring
+        """
+        self.vocabulary = sorted(vocabulary or ResumeParser.SKILL_MATCHER.categories)
+        self.columns = {skill: column for column, skill in enumerate(self.vocabulary)}
+        self.memory_budget = memory_budget
+        self.num_jobs = len(job_term_lists)
+        self.ranker = BM25Ranker(stats or CorpusStats.from_jobs(job_term_lists))
+
+        self.weights = np.zeros((len(self.vocabulary), self.num_jobs), dtype=np.float32)
+        for position, terms in enumerate(job_term_lists):
+            length_norm = self.ranker.length_norm(terms['length'])
+            title_skills = set(terms['title_skills'])
+            for skill, tf in terms['skill_counts'].items():
+                if skill in self.columns:
+                    self.weights[self.columns[skill], position] = self.ranker.term_weight(
+                        skill, tf, skill in title_skills, length_norm
+                    )
+
+    @classmethod
+    def from_jobs(cls, jobs, **kwargs):
+        """Build a scorer from job dicts"""
+        return cls([job_terms(job) for job in jobs], **kwargs)
+
+    def encode_resumes(self, resume_skill_lists):
+        """Return a resumes x skills matrix of proficiency weights"""
+        matrix = np.zeros((len(resume_skill_lists), len(self.vocabulary)), dtype=np.float32)
+        for row, resume_skills in enumerate(resume_skill_lists):
+            for skill, weight in self.ranker.query_weights(resume_skills).items():
+                column = self.columns.get(skill)
+                if column is not None:
+                    matrix[row, column] = weight
+        return matrix
+
+    def chunk_rows(self):
+        """Resumes scored per chunk so the chunk stays within the memory budget"""
+        available = self.memory_budget - self.weights.nbytes
+        return max(1, available // max(1, self.num_jobs * BYTES_PER_SCORE))
+
+    def top_k(self, resume_skill_lists, k=20):
+        """
+        Yield the best jobs for each resume, in input order
+
+        Jobs sharing no skill with the resume score 0 and are left out.
+        Among jobs tied at the K-th score, which ones are kept is arbitrary;
+        the kept jobs are ordered by relevance, then by job position.
+
+        Args:
+            resume_skill_lists: List of skill object lists, one per resume
+            k: Jobs to return per resume
+
+        Yields:
+            List of (job position, relevance) per resume
+        """
+        k = min(k, self.num_jobs)
+        chunk_rows = self.chunk_rows()
+        logger.info(f"Scoring {len(resume_skill_lists)} resumes against {self.num_jobs} jobs, "
+                    f"{chunk_rows} resumes per chunk")
+
+        for start in range(0, len(resume_skill_lists), chunk_rows):
+            chunk = resume_skill_lists[start:start + chunk_rows]
+            if k == 0:
+                yield from ([] for _ in chunk)
+                continue
+
+            scores = self.encode_resumes(chunk) @ self.weights
+
+            top = np.argpartition(scores, self.num_jobs - k, axis=1)[:, self.num_jobs - k:]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            del scores
+
+            for positions, row_scores in zip(top, top_scores):
+                ranked = sorted(
+                    (
+                        (int(position), float(score))
+                        for position, score in zip(positions, row_scores)
+                        if score > 0
+                    ),
+                    key=lambda item: (-item[1], item[0])
+                )
+                yield ranked
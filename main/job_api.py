@@ -3,10 +3,26 @@ Job Search API Integration Service
 Fetches job recommendations based on resume skills
 """
 import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
 from django.core.cache import cache
+from django.db import connection
+from email.utils import parsedate_to_datetime
 import logging
+import random
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from main.job_cache import (
+    QUERY_SEPARATOR, canonical_location, canonical_query, canonical_top_skills, page_cache_key, page_cache_stats
+)
+from main.job_index import search_local_jobs, upsert_jobs
 from main.mock_api import get_mock_jobs
+from main.ranking import RankedJobs
+from main.skill_index import extract_job_terms
+from main.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +30,86 @@ logger = logging.getLogger(__name__)
 DEFAULT_JSEARCH_API_KEY = "ak_0kd18786e2nzusm60nw0adtx8q5rtxbrjmph67vvf5zttv2"
 
 
+class TokenBucket:
+    """Thread-safe token bucket that paces calls to an upstream API"""
+    
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available and take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait_seconds)
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter():
+    """Process-wide token bucket for JSearch requests"""
+    return TokenBucket(
+        rate=getattr(settings, 'JSEARCH_REQUESTS_PER_SECOND', 2),
+        capacity=getattr(settings, 'JSEARCH_BURST', 3),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_session():
+    """
+    Process-wide HTTP session so connections to JSearch are kept alive
+    
+    Retries are handled by JobSearchAPI, so the adapter itself never retries.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Coalesces identical page fetches across threads in this process
+page_fetches = SingleFlight()
+
+# Cache keys with a background refresh queued or running in this process
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_refresh_executor():
+    """Process-wide threads that refresh soft-expired job pages"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix='jsearch-refresh')
+
+
+class MockFallback(Exception):
+    """Raised when the API cannot serve real data and mock jobs should be used"""
+    
+    def __init__(self, num_jobs):
+        super().__init__(f"Falling back to {num_jobs} mock jobs")
+        self.num_jobs = num_jobs
+
+
 class JobSearchAPI:
     """Handle JSearch API requests"""
     
-    BASE_URL = "https://jsearch.p.rapidapi.com/search"
+    BASE_URL = getattr(settings, 'JSEARCH_BASE_URL', "https://jsearch.p.rapidapi.com/search")
     
     def __init__(self, api_key=None):
         # Use provided key or fall back to default
@@ -27,10 +119,71 @@ class JobSearchAPI:
             "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
         }
     
+    # Jobs per JSearch results page
+    PAGE_SIZE = 10
+    
+    # Upper bound on pages fetched at the same time for one search
+    MAX_CONCURRENT_PAGES = 4
+    
+    # How long another worker's fetch of the same page is waited for
+    FETCH_LOCK_TIMEOUT = 30
+    
+    # Cached pages are fresh for SOFT_TTL seconds, then served while a
+    # background refresh runs. After HARD_TTL they are refetched before
+    # use, but the last good copy is still served for up to STALE_TTL more
+    # seconds if that fetch fails.
+    SOFT_TTL = getattr(settings, 'JSEARCH_CACHE_SOFT_TTL', 6 * 3600)
+    HARD_TTL = getattr(settings, 'JSEARCH_CACHE_HARD_TTL', 24 * 3600)
+    STALE_TTL = getattr(settings, 'JSEARCH_CACHE_STALE_TTL', 3 * 24 * 3600)
+    
+    # (connect, read) timeouts in seconds
+    TIMEOUT = (3.05, 10)
+    
+    # Retries for throttling, server errors and dropped connections, with
+    # jittered exponential backoff capped at MAX_BACKOFF seconds
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 0.5
+    MAX_BACKOFF = 8
+    
+    def find_jobs(self, query, num_pages=1, location=None):
+        """
+        Find jobs in the local index first, calling the API only to fill gaps
+        
+        Indexed jobs sharing the most skills with the query come first. If
+        the index holds a full set of num_pages pages of matches, no API
+        call is made. Otherwise the API results are appended after
+        the indexed jobs, skipping jobs already found locally.
+        
+        Returns:
+            List of job results
+        """
+        query = canonical_query(query)
+        location = canonical_location(location) or None
+        wanted = num_pages * self.PAGE_SIZE
+        
+        jobs = search_local_jobs(query, location, limit=wanted)
+        if len(jobs) >= wanted:
+            return jobs
+        
+        seen_ids = {job['job_id'] for job in jobs}
+        for job in self.search_jobs(query, num_pages=num_pages, location=location):
+            if job.get('job_id') not in seen_ids:
+                seen_ids.add(job.get('job_id'))
+                jobs.append(job)
+        return jobs
+    
     def search_jobs(self, query, num_pages=1, location=None):
         """
         Search for jobs using JSearch API
         
+        The query and location are canonicalized first, so equivalent
+        searches share cache entries. Fresh cached pages are used as-is. Pages past the soft TTL are
+        served from cache and refreshed in the background. Missing and
+        hard-expired pages are fetched concurrently, paced by the shared
+        token bucket, and a hard-expired page falls back to its stale copy
+        if the fetch fails. Fetched jobs are upserted into the local index.
+        
         Args:
             query: Job search query (skills/keywords)
             num_pages: Number of pages to fetch
@@ -39,80 +192,258 @@ class JobSearchAPI:
         Returns:
             List of job results
         """
+        query = canonical_query(query)
+        location = canonical_location(location) or None
+        
         try:
-            all_jobs = []
+            pages = {}
+            stale_pages = {}
+            missing_pages = []
             
             for page in range(1, num_pages + 1):
                 # Check cache first
-                cache_key = f"jobs_{query}_{page}_{location}"
-                cached_jobs = cache.get(cache_key)
-                if cached_jobs is not None:
-                    all_jobs.extend(cached_jobs)
+                entry = self._get_cached_page(query, page, location)
+                if entry is None:
+                    page_cache_stats.record('miss')
+                    missing_pages.append(page)
                     continue
                 
-                params = {
-                    "query": query,
-                    "page": str(page),
-                    "num_pages": "1",
-                    "date_posted": "month",
-                    "country": "IN"  # Focus on India
-                }
-                
-                if location:
-                    params["location"] = location
-                
-                # Rate limiting: wait 1 second between requests
-                if page > 1:
-                    time.sleep(1)
+                age = time.time() - entry['fetched_at']
+                if age < self.SOFT_TTL:
+                    page_cache_stats.record('fresh')
+                    pages[page] = entry['jobs']
+                elif age < self.HARD_TTL:
+                    page_cache_stats.record('stale')
+                    pages[page] = entry['jobs']
+                    self._schedule_refresh(query, page, location)
+                else:
+                    page_cache_stats.record('expired')
+                    stale_pages[page] = entry['jobs']
+                    missing_pages.append(page)
+            
+            if missing_pages:
+                max_workers = min(len(missing_pages), self.MAX_CONCURRENT_PAGES)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        page: executor.submit(self._fetch_page_coalesced, query, page, location)
+                        for page in missing_pages
+                    }
+                    fetched_jobs = []
+                    for page, future in futures.items():
+                        try:
+                            pages[page] = future.result()
+                            fetched_jobs.extend(pages[page])
+                        except Exception as e:
+                            if page not in stale_pages:
+                                raise
+                            logger.warning(f"Refetching page {page} for '{query}' failed, serving stale copy: {e}")
+                            pages[page] = stale_pages[page]
                 
-                response = requests.get(
+                upsert_jobs(fetched_jobs)
+            
+            all_jobs = []
+            for page in sorted(pages):
+                all_jobs.extend(pages[page])
+            return all_jobs
+        
+        except MockFallback as e:
+            return get_mock_jobs(query, location, num_jobs=e.num_jobs)
+        except Exception as e:
+            logger.error(f"Error in search_jobs: {str(e)}")
+            raise
+    
+    def _cache_key(self, query, page, location):
+        return page_cache_key(query, page, location)
+    
+    def _get_cached_page(self, query, page, location):
+        """Return the cached {'jobs', 'fetched_at'} entry for a page, or None"""
+        entry = cache.get(self._cache_key(query, page, location))
+        if not isinstance(entry, dict) or 'fetched_at' not in entry:
+            return None
+        return entry
+    
+    def _schedule_refresh(self, query, page, location):
+        """Refresh a soft-expired page in the background, once per key"""
+        cache_key = self._cache_key(query, page, location)
+        with _refreshing_lock:
+            if cache_key in _refreshing:
+                return
+            _refreshing.add(cache_key)
+        
+        get_refresh_executor().submit(self._refresh_page, query, page, location)
+    
+    def _refresh_page(self, query, page, location):
+        cache_key = self._cache_key(query, page, location)
+        try:
+            upsert_jobs(self._fetch_page_coalesced(query, page, location))
+        except Exception as e:
+            # The cached copy keeps being served until it expires
+            logger.warning(f"Background refresh of {cache_key} failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(cache_key)
+            # Refresh threads are long-lived, so don't hold a connection open
+            connection.close()
+    
+    def _fetch_page_coalesced(self, query, page, location):
+        """
+        Fetch a page with at most one upstream call per cache key
+        
+        Threads share one in-flight call through page_fetches. Across
+        worker processes, a lock entry added to the shared cache elects
+        one fetcher and the others wait for its cached result. If the
+        cache is not shared between processes, each process fetches for
+        itself.
+        """
+        cache_key = self._cache_key(query, page, location)
+        return page_fetches.do(cache_key, lambda: self._fetch_page_locked(query, page, location))
+    
+    def _fetch_page_locked(self, query, page, location):
+        """
+        Fetch a page, or wait for the process holding its lock to cache it
+        
+        The lock entry holds a token unique to this call, so only the call
+        that added it deletes it. A waiter whose deadline passes fetches
+        without the lock and leaves it alone.
+        """
+        cache_key = self._cache_key(query, page, location)
+        lock_key = f"{cache_key}_lock"
+        token = uuid.uuid4().hex
+        
+        holds_lock = cache.add(lock_key, token, self.FETCH_LOCK_TIMEOUT)
+        if not holds_lock:
+            waiting_since = time.time()
+            deadline = time.monotonic() + self.FETCH_LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(0.1)
+                # Only a copy fetched while waiting counts, not a stale one
+                entry = self._get_cached_page(query, page, location)
+                if entry is not None and entry['fetched_at'] >= waiting_since:
+                    page_fetches.record('coalesced_remote')
+                    return entry['jobs']
+                if cache.get(lock_key) is None:
+                    # The other fetch finished without caching, try to take over
+                    holds_lock = cache.add(lock_key, token, self.FETCH_LOCK_TIMEOUT)
+                    if holds_lock:
+                        break
+        
+        try:
+            page_fetches.record('upstream')
+            return self._fetch_page(query, page, location)
+        finally:
+            # The cache has no compare-and-delete; the lock could only change
+            # hands in between if this fetch outlived FETCH_LOCK_TIMEOUT
+            if holds_lock and cache.get(lock_key) == token:
+                cache.delete(lock_key)
+    
+    def _fetch_page(self, query, page, location):
+        """Fetch and cache one page of results, waiting for a rate limit token"""
+        params = {
+            "query": query,
+            "page": str(page),
+            "num_pages": "1",
+            "date_posted": "month",
+            "country": "IN"  # Focus on India
+        }
+        
+        if location:
+            params["location"] = location
+        
+        response = self._get_with_retries(params)
+        
+        if response.status_code == 200:
+            data = response.json()
+            jobs = data.get('data', [])
+            
+            page_jobs = []
+            for job in jobs:
+                page_jobs.append({
+                    'job_id': job.get('job_id', ''),
+                    'title': job.get('job_title', 'N/A'),
+                    'company': job.get('employer_name', 'N/A'),
+                    'location': job.get('job_location', 'N/A'),
+                    'salary': self._extract_salary(job),
+                    'job_type': job.get('job_employment_type', 'N/A'),
+                    'description': job.get('job_description', ''),
+                    'apply_link': job.get('job_apply_link', ''),
+                    'posted_date': job.get('job_posted_at_datetime_utc', ''),
+                })
+                # Extract skills and term statistics once per fetch
+                page_jobs[-1].update(extract_job_terms(page_jobs[-1]))
+            
+            # Keep the page until it is past the hard TTL and the stale window
+            cache.set(
+                self._cache_key(query, page, location),
+                {'jobs': page_jobs, 'fetched_at': time.time()},
+                self.HARD_TTL + self.STALE_TTL
+            )
+            return page_jobs
+        elif response.status_code == 403:
+            error_msg = response.json().get('message', 'Not subscribed to API')
+            logger.error(f"API Error 403: {error_msg} - Using mock data for testing")
+            # Fall back to mock data for testing
+            logger.warning("RapidAPI subscription not active - using mock job data")
+            raise MockFallback(num_jobs=10)
+        elif response.status_code == 429:
+            logger.error(f"API Error 429: Too many requests - Using mock data")
+            # Fall back to mock data when rate limited
+            raise MockFallback(num_jobs=5)
+        else:
+            error_msg = response.json().get('message', response.text) if response.headers.get('content-type') == 'application/json' else response.text
+            logger.error(f"API Error: {response.status_code} - {error_msg}")
+            raise Exception(f"API Error {response.status_code}: {error_msg}")
+    
+    def _get_with_retries(self, params):
+        """
+        GET the search endpoint on the shared session, retrying on 429/5xx
+        
+        Every attempt waits for a rate limit token. The last response is
+        returned even if it is still a retryable error.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            get_rate_limiter().acquire()
+            
+            try:
+                response = get_session().get(
                     self.BASE_URL,
                     headers=self.headers,
                     params=params,
-                    timeout=10
+                    timeout=self.TIMEOUT
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    jobs = data.get('data', [])
-                    
-                    page_jobs = []
-                    for job in jobs:
-                        page_jobs.append({
-                            'job_id': job.get('job_id', ''),
-                            'title': job.get('job_title', 'N/A'),
-                            'company': job.get('employer_name', 'N/A'),
-                            'location': job.get('job_location', 'N/A'),
-                            'salary': self._extract_salary(job),
-                            'job_type': job.get('job_employment_type', 'N/A'),
-                            'description': job.get('job_description', ''),
-                            'apply_link': job.get('job_apply_link', ''),
-                            'posted_date': job.get('job_posted_at_datetime_utc', ''),
-                        })
-                    
-                    all_jobs.extend(page_jobs)
-                    # Cache results for 24 hours (86400 seconds)
-                    cache.set(cache_key, page_jobs, 86400)
-                elif response.status_code == 403:
-                    error_msg = response.json().get('message', 'Not subscribed to API')
-                    logger.error(f"API Error 403: {error_msg} - Using mock data for testing")
-                    # Fall back to mock data for testing
-                    logger.warning("RapidAPI subscription not active - using mock job data")
-                    return get_mock_jobs(query, location, num_jobs=10)
-                elif response.status_code == 429:
-                    logger.error(f"API Error 429: Too many requests - Using mock data")
-                    # Fall back to mock data when rate limited
-                    return get_mock_jobs(query, location, num_jobs=5)
-                else:
-                    error_msg = response.json().get('message', response.text) if response.headers.get('content-type') == 'application/json' else response.text
-                    logger.error(f"API Error: {response.status_code} - {error_msg}")
-                    raise Exception(f"API Error {response.status_code}: {error_msg}")
-                    
-            return all_jobs
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"JSearch request failed ({e}), retrying in {delay:.2f}s")
+            else:
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                logger.warning(f"JSearch returned {response.status_code}, retrying in {delay:.2f}s")
             
-        except Exception as e:
-            logger.error(f"Error in search_jobs: {str(e)}")
-            raise
+            time.sleep(delay)
+    
+    def _backoff_delay(self, attempt):
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.MAX_BACKOFF, self.BACKOFF_BASE * 2 ** attempt))
+    
+    def _retry_after(self, response):
+        """Seconds from a Retry-After header (delta or HTTP date), capped at MAX_BACKOFF"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        
+        return min(self.MAX_BACKOFF, max(0.0, seconds))
     
     def _extract_salary(self, job_data):
         """Extract salary information"""
@@ -147,41 +478,42 @@ class JobRecommendationEngine:
             pages: Number of pages to fetch
         
         Returns:
-            List of recommended jobs
+            RankedJobs, best first and evaluated lazily as it is sliced
         """
         if not self.api:
             logger.warning("API not configured")
-            return []
+            return RankedJobs([], resume_skills)
         
-        # Build search query from top skills
-        skill_names = [skill.get('name', '').lower() for skill in resume_skills[:5]]
-        query = " OR ".join(skill_names) if skill_names else "developer"
+        # Build search query from the strongest skills, in canonical order
+        # so the same skill set always hits the same cache entry
+        skill_names = canonical_top_skills(resume_skills, limit=5)
+        query = QUERY_SEPARATOR.join(skill_names) if skill_names else "developer"
         
-        # Search for jobs
-        jobs = self.api.search_jobs(query, num_pages=pages, location=location)
+        # Search the local index, then the API for any shortfall
+        jobs = self.api.find_jobs(query, num_pages=pages, location=location)
         
-        # Calculate match scores
-        matched_jobs = []
-        for job in jobs:
-            match_score, matching_skills = self._calculate_match_score(
-                job,
-                resume_skills
-            )
-            
-            job['match_score'] = match_score
-            job['matching_skills'] = matching_skills
-            
-            if match_score > 0:  # Only include jobs with at least some match
-                matched_jobs.append(job)
+        return RankedJobs(jobs, resume_skills)
+    
+    def rank_jobs(self, jobs, resume_skills, stats=None):
+        """
+        Fully rank candidate jobs for a resume, best first
         
-        # Sort by match score
-        matched_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+        Only jobs sharing a skill with the resume are returned. Each gets
+        relevance, match_score and matching_skills set.
         
-        return matched_jobs
+        Args:
+            jobs: Candidate job dicts
+            resume_skills: List of skill objects
+            stats: CorpusStats for IDF, defaults to the local index
+        """
+        return list(RankedJobs(jobs, resume_skills, stats=stats))
     
     def _calculate_match_score(self, job, resume_skills):
         """
-        Calculate match score between job and resume
+        Calculate match score between job and resume by substring search
+        
+        recommend_jobs ranks with BM25Ranker instead; this is kept as the
+        reference scorer for benchmarks and evaluation.
         
         Returns:
             Tuple of (score, matching_skills)
@@ -224,7 +556,7 @@ def get_recommended_jobs(resume_skills, api_key=None, location=None, pages=2):
     
     if not api_key_to_use or api_key_to_use.strip() == 'PLACEHOLDER':
         logger.warning("API key not configured")
-        return []
+        return RankedJobs([], resume_skills)
     
     engine = JobRecommendationEngine(api_key=api_key_to_use)
     return engine.recommend_jobs(resume_skills, location=location, pages=pages)
@@ -239,4 +571,4 @@ def search_jobs_by_keyword(keyword, api_key, location=None):
         return []
     
     api = JobSearchAPI(api_key=api_key)
-    return api.search_jobs(keyword, num_pages=2, location=location)
+    return api.find_jobs(keyword, num_pages=2, location=location)
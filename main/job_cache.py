@@ -0,0 +1,133 @@
+"""
+Job Search Cache Keys
+Canonicalizes search queries and locations into compact cache keys, so
+equivalent searches from different users share cache entries, and counts
+cache outcomes for hit-rate reporting
+"""
+import hashlib
+import re
+import threading
+
+from main.reverse_match import proficiency_weight
+
+# Alternate spellings resolved to the skill names used by the resume parser
+SKILL_ALIASES = {
+    'js': 'javascript',
+    'ecmascript': 'javascript',
+    'ts': 'typescript',
+    'golang': 'go',
+    'py': 'python',
+    'python3': 'python',
+    'cpp': 'c++',
+    'csharp': 'c#',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'angularjs': 'angular',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'expressjs': 'express',
+    'express.js': 'express',
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'mongo': 'mongodb',
+    'k8s': 'kubernetes',
+    'amazon web services': 'aws',
+    'google cloud': 'gcp',
+    'google cloud platform': 'gcp',
+    'microsoft azure': 'azure',
+    'sklearn': 'scikit-learn',
+    'scikit learn': 'scikit-learn',
+    'ci cd': 'ci/cd',
+    'cicd': 'ci/cd',
+    'problem solving': 'problem-solving',
+}
+
+QUERY_SEPARATOR = ' OR '
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def canonical_skill(name):
+    """Lowercase, collapse whitespace and resolve aliases"""
+    name = _WHITESPACE.sub(' ', (name or '').strip().lower())
+    return SKILL_ALIASES.get(name, name)
+
+
+def canonical_skills(names):
+    """Sorted, deduplicated canonical skill names, without blanks"""
+    return sorted({skill for skill in map(canonical_skill, names) if skill})
+
+
+def canonical_top_skills(resume_skills, limit=5):
+    """
+    The resume's strongest canonical skills, in canonical order
+
+    The whole skill list is canonicalized and deduplicated first, keeping
+    each skill's highest proficiency, then ranked by proficiency and name.
+    Resumes with the same skill set therefore give the same skills
+    whatever order they were found in.
+    """
+    weights = {}
+    for skill in resume_skills:
+        name = canonical_skill(skill.get('name', ''))
+        if name:
+            weights[name] = max(weights.get(name, 0.0), proficiency_weight(skill.get('proficiency')))
+
+    strongest = sorted(weights, key=lambda name: (-weights[name], name))[:limit]
+    return sorted(strongest)
+
+
+def canonical_query(query):
+    """
+    Canonical form of a search query
+
+    An OR query is treated as a skill set, so its terms are canonicalized
+    and sorted. Any other query is only lowercased and whitespace-collapsed.
+    """
+    query = _WHITESPACE.sub(' ', (query or '').strip())
+    if QUERY_SEPARATOR in query:
+        return QUERY_SEPARATOR.join(canonical_skills(query.split(QUERY_SEPARATOR)))
+    return canonical_skill(query)
+
+
+def canonical_location(location):
+    """Lowercased, whitespace-collapsed location, or '' for none"""
+    return _WHITESPACE.sub(' ', (location or '').strip().lower())
+
+
+def page_cache_key(query, page, location):
+    """
+    Compact cache key for one page of search results
+
+    Expects an already canonical query and location. They are hashed so
+    the key has a fixed length whatever the user typed.
+    """
+    digest = hashlib.sha256(f"{query}\n{location}".encode()).hexdigest()[:24]
+    return f"jobs_{digest}_{page}"
+
+
+class CacheStats:
+    """Thread-safe counts of cache outcomes in this process"""
+
+    OUTCOMES = ('fresh', 'stale', 'expired', 'miss')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = dict.fromkeys(self.OUTCOMES, 0)
+
+    def record(self, outcome):
+        """Count one lookup: fresh, stale (soft-expired), expired (hard) or miss"""
+        with self.lock:
+            self.counts[outcome] += 1
+
+    def get_stats(self):
+        """Return outcome counts and the share of lookups served from cache"""
+        with self.lock:
+            stats = dict(self.counts)
+        total = sum(stats.values())
+        stats['hit_rate'] = (stats['fresh'] + stats['stale']) / total if total else 0.0
+        return stats
+
+
+# Page lookups made by JobSearchAPI in this process
+page_cache_stats = CacheStats()
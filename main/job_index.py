@@ -0,0 +1,182 @@
+"""
+Local Job Index
+Persists fetched jobs in JobResult so recommendations and keyword searches
+can be served from the database before calling the JSearch API
+"""
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from main.job_cache import QUERY_SEPARATOR
+from main.models import JobResult, JobSkill
+from main.skill_index import JOB_SKILL_MATCHER, job_terms
+
+logger = logging.getLogger(__name__)
+
+# Job dict keys stored in JobResult, also the fields covered by the content hash
+JOB_FIELDS = (
+    'title', 'company', 'location', 'salary', 'job_type', 'description', 'apply_link', 'posted_date'
+)
+
+# Fields rewritten when a fetched job has changed
+UPSERT_UPDATE_FIELDS = JOB_FIELDS + ('length', 'content_hash', 'updated_at', 'last_seen_at')
+
+UPSERT_BATCH_SIZE = 500
+
+# Column lengths of the stored CharFields; upstream values can be longer
+FIELD_MAX_LENGTHS = {
+    field: JobResult._meta.get_field(field).max_length for field in ('job_id',) + JOB_FIELDS
+}
+
+
+def _truncate(field, value):
+    """Cut a job field to the length of its JobResult column, if it has one"""
+    max_length = FIELD_MAX_LENGTHS.get(field)
+    return value[:max_length] if max_length and isinstance(value, str) else value
+
+
+def job_content_hash(job):
+    """SHA-256 of the stored fields of a job dict"""
+    content = json.dumps([job.get(field) or '' for field in JOB_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def job_to_dict(job_result):
+    """
+    Convert a JobResult into the job dict shape returned by JobSearchAPI
+
+    Expects skill_postings to be prefetched, as search_local_jobs does.
+    """
+    job = {field: getattr(job_result, field) or '' for field in JOB_FIELDS}
+    job['job_id'] = job_result.job_id
+    postings = job_result.skill_postings.all()
+    job['skills'] = sorted(posting.skill for posting in postings)
+    job['title_skills'] = sorted(posting.skill for posting in postings if posting.in_title)
+    job['skill_counts'] = {posting.skill: posting.count for posting in postings}
+    job['length'] = job_result.length
+    return job
+
+
+def upsert_jobs(jobs):
+    """
+    Insert or update fetched jobs in JobResult, keyed by job_id
+
+    Jobs whose content hash matches the stored row only get last_seen_at
+    bumped, and the rest are written with one bulk_create per batch. The skill postings
+    of written jobs are replaced at the same time. Values longer than
+    their column are truncated, so one oversized upstream job cannot fail
+    the whole search.
+
+    Returns:
+        Number of jobs inserted or updated
+    """
+    by_id = {_truncate('job_id', job['job_id']): job for job in jobs if job.get('job_id')}
+    if not by_id:
+        return 0
+
+    hashes = {job_id: job_content_hash(job) for job_id, job in by_id.items()}
+    stored_hashes = dict(
+        JobResult.objects.filter(job_id__in=list(by_id)).values_list('job_id', 'content_hash')
+    )
+
+    now = timezone.now()
+    changed = [
+        JobResult(
+            job_id=job_id,
+            length=job_terms(by_id[job_id])['length'],
+            content_hash=hashes[job_id],
+            last_seen_at=now,
+            **{field: _truncate(field, by_id[job_id].get(field) or '') for field in JOB_FIELDS},
+        )
+        for job_id in by_id
+        if stored_hashes.get(job_id) != hashes[job_id]
+    ]
+
+    # Unchanged jobs are not rewritten, but are still live upstream
+    unchanged = [job_id for job_id in by_id if stored_hashes.get(job_id) == hashes[job_id]]
+    if unchanged:
+        JobResult.objects.filter(job_id__in=unchanged).update(last_seen_at=now)
+
+    if changed:
+        with transaction.atomic():
+            JobResult.objects.bulk_create(
+                changed,
+                batch_size=UPSERT_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=['job_id'],
+                update_fields=list(UPSERT_UPDATE_FIELDS),
+            )
+            _replace_skill_postings({job_result.job_id: by_id[job_result.job_id] for job_result in changed})
+        logger.info(f"Upserted {len(changed)} of {len(by_id)} fetched jobs into the local index")
+    return len(changed)
+
+
+def _replace_skill_postings(jobs_by_id):
+    """Rewrite the JobSkill postings of the given jobs from their term statistics"""
+    # Primary keys are not set on upserted objects by every backend
+    pks = dict(JobResult.objects.filter(job_id__in=list(jobs_by_id)).values_list('job_id', 'pk'))
+    JobSkill.objects.filter(job_id__in=pks.values()).delete()
+
+    postings = []
+    for job_id, job in jobs_by_id.items():
+        terms = job_terms(job)
+        title_skills = set(terms['title_skills'])
+        postings.extend(
+            JobSkill(
+                job_id=pks[job_id],
+                skill=skill,
+                in_title=skill in title_skills,
+                count=terms['skill_counts'].get(skill, 1),
+            )
+            for skill in terms['skills']
+        )
+    JobSkill.objects.bulk_create(postings, batch_size=UPSERT_BATCH_SIZE)
+
+
+def search_local_jobs(query, location=None, limit=None):
+    """
+    Find indexed jobs matching a canonical query
+
+    A skill set, meaning an OR query or a single known skill, matches jobs
+    through their skill postings, so "go" never matches "Google". Jobs with
+    postings for more of its skills come first, then the most recently
+    seen. Any other query must appear as a whole in the title or
+    description, most recently seen first. Only jobs seen upstream within
+    JSEARCH_INDEX_MAX_AGE seconds are returned.
+
+    Args:
+        query: Canonical query, see main.job_cache.canonical_query
+        location: Optional canonical location filter
+        limit: Maximum number of jobs to return
+
+    Returns:
+        List of job dicts
+    """
+    terms = [term for term in query.split(QUERY_SEPARATOR) if term]
+    if not terms:
+        return []
+
+    max_age = getattr(settings, 'JSEARCH_INDEX_MAX_AGE', 24 * 60 * 60)
+    results = JobResult.objects.filter(last_seen_at__gte=timezone.now() - timedelta(seconds=max_age))
+    if location:
+        results = results.filter(location__icontains=location)
+
+    if len(terms) > 1 or terms[0] in JOB_SKILL_MATCHER.categories:
+        results = results.annotate(
+            matched_skills=Count('skill_postings', filter=Q(skill_postings__skill__in=terms))
+        ).filter(matched_skills__gt=0).order_by('-matched_skills', '-last_seen_at', 'job_id')
+    else:
+        results = results.filter(
+            Q(title__icontains=terms[0]) | Q(description__icontains=terms[0])
+        ).order_by('-last_seen_at', 'job_id')
+
+    results = results.prefetch_related('skill_postings')
+    if limit is not None:
+        results = results[:limit]
+    return [job_to_dict(job_result) for job_result in results]
@@ -0,0 +1,119 @@
+"""
+Drain the resume parse queue with bounded concurrency
+
+Usage: python manage.py run_parse_worker [--concurrency 2] [--once] [--metrics-port 9100]
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import django
+from django.core.management.base import BaseCommand
+
+from main.parse_metrics import observe_parse_metrics, render_metrics
+from main.parse_queue import claim_next_job, complete_job, parse_job_file, release_job, requeue_stale_jobs
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serve the parse stage histograms for scraping"""
+
+    def do_GET(self):
+        body = render_metrics().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = 'Parse queued resume uploads in worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=2,
+                            help='Number of resumes parsed at the same time')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds to wait between polls of an empty queue')
+        parser.add_argument('--stale-after', type=int, default=600,
+                            help='Requeue jobs stuck in processing for this many seconds')
+        parser.add_argument('--once', action='store_true',
+                            help='Exit once the queue is empty')
+        parser.add_argument('--metrics-port', type=int,
+                            help='Serve parse stage histograms on this port')
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency']
+        poll_interval = options['poll_interval']
+
+        requeued = requeue_stale_jobs(options['stale_after'])
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale job(s)")
+
+        if options['metrics_port']:
+            server = ThreadingHTTPServer(('', options['metrics_port']), MetricsHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.stdout.write(f"Serving parse metrics on port {options['metrics_port']}")
+
+        self.stdout.write(f"Parse worker started with concurrency {concurrency}")
+
+        running = {}
+        executor = self.start_pool(concurrency)
+        try:
+            while True:
+                pool_broken = False
+                while len(running) < concurrency:
+                    job = claim_next_job()
+                    if job is None:
+                        break
+                    try:
+                        future = executor.submit(parse_job_file, job.file_name, bytes(job.file_data))
+                    except BrokenProcessPool:
+                        # Not started, so it can safely run in the new pool
+                        release_job(job)
+                        pool_broken = True
+                        break
+                    running[future] = job
+
+                if not running and not pool_broken:
+                    if options['once']:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                done, _ = wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        parsed_data = future.result()
+                        # Sampled timings were measured in the pool process
+                        if parsed_data and 'parse_metrics' in parsed_data:
+                            observe_parse_metrics(parsed_data['parse_metrics'])
+                        complete_job(job, parsed_data=parsed_data)
+                    except BrokenProcessPool:
+                        # The crash may have been caused by this upload, so it
+                        # is failed rather than retried
+                        pool_broken = True
+                        complete_job(job, error='The parser process crashed while reading this file.')
+                    except Exception as e:
+                        complete_job(job, error=str(e))
+                    self.stdout.write(f"Job {job.pk} ({job.file_name}): {job.status}")
+
+                if pool_broken:
+                    # Every job still running in the broken pool failed with it
+                    for job in running.values():
+                        complete_job(job, error='The parser process crashed while reading this file.')
+                        self.stdout.write(f"Job {job.pk} ({job.file_name}): {job.status}")
+                    running.clear()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self.stderr.write("A parser process died, starting a new pool")
+                    executor = self.start_pool(concurrency)
+        finally:
+            executor.shutdown()
+
+    def start_pool(self, concurrency):
+        return ProcessPoolExecutor(max_workers=concurrency, initializer=django.setup)
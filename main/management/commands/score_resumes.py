@@ -0,0 +1,65 @@
+"""
+Score every stored resume against every indexed job
+
+Usage: python manage.py score_resumes --output scores.jsonl [--top-k 20] [--memory-mb 256]
+"""
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from main.batch_scoring import BatchScorer
+from main.models import JobSkill, Resume
+from main.ranking import CorpusStats
+
+
+class Command(BaseCommand):
+    help = 'Compute the top-K indexed jobs for every resume in one batch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=20,
+                            help='Jobs kept per resume')
+        parser.add_argument('--memory-mb', type=int, default=256,
+                            help='Approximate memory used while scoring')
+        parser.add_argument('--output', required=True,
+                            help='Write one JSON line per resume to this file')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        # Rebuild each job's term statistics from its JobSkill postings
+        terms = {}
+        job_ids = {}
+        postings = JobSkill.objects.values_list(
+            'job_id', 'job__job_id', 'job__length', 'skill', 'in_title', 'count'
+        ).iterator()
+        for pk, job_id, length, skill, in_title, count in postings:
+            job_ids[pk] = job_id
+            job = terms.setdefault(pk, {'skills': [], 'title_skills': [], 'skill_counts': {}, 'length': length})
+            job['skills'].append(skill)
+            job['skill_counts'][skill] = count
+            if in_title:
+                job['title_skills'].append(skill)
+
+        pks = sorted(job_ids)
+        scorer = BatchScorer(
+            [terms[pk] for pk in pks],
+            stats=CorpusStats.from_index(),
+            memory_budget=options['memory_mb'] * 1024 ** 2,
+        )
+
+        resumes = list(Resume.objects.values_list('pk', 'skills'))
+        self.stdout.write(f"Scoring {len(resumes)} resume(s) against {len(pks)} indexed job(s)")
+
+        ranked_lists = scorer.top_k([resume_skills for _, resume_skills in resumes], k=options['top_k'])
+        with open(options['output'], 'w') as output:
+            for (resume_pk, _), ranked in zip(resumes, ranked_lists):
+                output.write(json.dumps({
+                    'resume_id': resume_pk,
+                    'jobs': [
+                        {'job_id': job_ids[pks[position]], 'relevance': round(relevance, 4)}
+                        for position, relevance in ranked
+                    ],
+                }) + '\n')
+
+        self.stdout.write(self.style.SUCCESS(f"Scored in {time.perf_counter() - started:.2f}s"))
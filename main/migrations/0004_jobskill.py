@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def reset_content_hashes(apps, schema_editor):
+    """Make already indexed jobs count as changed so their postings are written"""
+    JobResult = apps.get_model('main', 'JobResult')
+    JobResult.objects.update(content_hash='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_jobresult_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('in_title', models.BooleanField(default=False)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_postings', to='main.jobresult')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'job'], name='main_jobski_skill_81e007_idx')],
+                'unique_together': {('job', 'skill')},
+            },
+        ),
+        migrations.RunPython(reset_content_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:02
+
+from django.db import migrations, models
+
+PROFICIENCY_WEIGHTS = {
+    'beginner': 1.0,
+    'intermediate': 1.5,
+    'advanced': 2.0,
+    'expert': 2.5,
+}
+
+
+def set_weights(apps, schema_editor):
+    """Derive the weight of existing skills from their proficiency"""
+    Skill = apps.get_model('main', 'Skill')
+    for skill in Skill.objects.all():
+        skill.weight = PROFICIENCY_WEIGHTS.get((skill.proficiency or '').lower(), 1.0)
+        skill.save(update_fields=['weight'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_jobskill'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='weight',
+            field=models.FloatField(default=1.0),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['name', 'resume', 'weight'], name='main_skill_name_7eb975_idx'),
+        ),
+        migrations.RunPython(set_weights, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:04
+
+from django.db import migrations, models
+
+
+def reset_content_hashes(apps, schema_editor):
+    """Make already indexed jobs count as changed so their term statistics are written"""
+    JobResult = apps.get_model('main', 'JobResult')
+    JobResult.objects.update(content_hash='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_skill_weight'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobresult',
+            name='length',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='jobskill',
+            name='count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(reset_content_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:27
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_updated_at(apps, schema_editor):
+    """Indexed jobs were last seen when they were last written"""
+    JobResult = apps.get_model('main', 'JobResult')
+    JobResult.objects.update(last_seen_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_job_term_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobresult',
+            name='last_seen_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(copy_updated_at, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 import json
 
 
@@ -44,16 +45,20 @@ class Skill(models.Model):
         ('expert', 'Expert'),
     ], default='intermediate')
     
+    # Proficiency as a number, used when ranking resumes for a job
+    weight = models.FloatField(default=1.0)
+    
     class Meta:
         unique_together = ('resume', 'name')
+        indexes = [models.Index(fields=['name', 'resume', 'weight'])]
     
     def __str__(self):
         return f"{self.name} - {self.proficiency}"
 
 
 class JobResult(models.Model):
-    """Model to store job search results"""
-    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='job_results')
+    """Model to store job search results, shared by all users as a local job index"""
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='job_results', null=True, blank=True)
     
     job_id = models.CharField(max_length=500, unique=True)
     title = models.CharField(max_length=300)
@@ -63,6 +68,7 @@ class JobResult(models.Model):
     job_type = models.CharField(max_length=100, null=True, blank=True)
     description = models.TextField(null=True, blank=True)
     apply_link = models.URLField(max_length=500)
+    posted_date = models.CharField(max_length=50, null=True, blank=True)
     
     # Match score based on resume skills
     match_score = models.FloatField(default=0.0)
@@ -70,12 +76,38 @@ class JobResult(models.Model):
     
     # Metadata
     fetched_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     source = models.CharField(max_length=100, default='jsearch')
     
+    # Last time the API returned this job, changed or not; the local index
+    # only serves jobs seen within JSEARCH_INDEX_MAX_AGE
+    last_seen_at = models.DateTimeField(default=timezone.now, db_index=True)
+    
+    # Hash of the fetched fields, used to skip rewriting unchanged jobs
+    content_hash = models.CharField(max_length=64, blank=True, default='')
+    
+    # Words in the job text, for length normalization when ranking
+    length = models.PositiveIntegerField(default=0)
+    
     def __str__(self):
         return f"{self.title} - {self.company}"
 
 
+class JobSkill(models.Model):
+    """Posting in the inverted index from skill name to indexed jobs"""
+    job = models.ForeignKey(JobResult, on_delete=models.CASCADE, related_name='skill_postings')
+    skill = models.CharField(max_length=100)
+    in_title = models.BooleanField(default=False)
+    count = models.PositiveIntegerField(default=1)
+    
+    class Meta:
+        unique_together = ('job', 'skill')
+        indexes = [models.Index(fields=['skill', 'job'])]
+    
+    def __str__(self):
+        return f"{self.skill} - {self.job_id}"
+
+
 class SavedJob(models.Model):
     """Model to store saved jobs by users"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_jobs')
@@ -105,3 +137,50 @@ class APIKey(models.Model):
     
     def __str__(self):
         return f"{self.api_name} API Key"
+
+
+class ResumeParseJob(models.Model):
+    """Uploaded resume waiting to be parsed by the run_parse_worker command"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='resume_parse_jobs')
+    file_name = models.CharField(max_length=255)
+    file_data = models.BinaryField()
+    
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    error = models.TextField(null=True, blank=True)
+    
+    # Metadata
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['created_at']
+    
+    def __str__(self):
+        return f"{self.file_name} - {self.status}"
+
+
+class ResumeParseCacheEntry(models.Model):
+    """Parse result of an uploaded file, reused when the same user uploads it again"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='resume_parse_cache')
+    
+    # PARSER_VERSION, file type and SHA-256 of the file contents
+    cache_key = models.CharField(max_length=200)
+    parsed_data = models.JSONField()
+    
+    # Metadata
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+    
+    class Meta:
+        unique_together = ('user', 'cache_key')
+    
+    def __str__(self):
+        return f"{self.cache_key} - {self.user.username}"
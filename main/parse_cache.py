@@ -0,0 +1,92 @@
+"""
+Resume Parse Cache
+Keeps the parse results of uploaded files in the database, keyed by the
+uploader and a SHA-256 of the file contents, so re-uploads of the same file
+skip text extraction and spaCy
+"""
+import hashlib
+import logging
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+from main.models import ResumeParseCacheEntry
+from main.services import PARSER_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+def resume_parse_cache_key(uploaded_file):
+    """
+    Cache key of an upload's parse result
+
+    Returns:
+        Tuple of (cache key, SHA-256 of the file contents)
+    """
+    file_type = Path(uploaded_file.name).suffix.lower().lstrip('.')
+
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    content_hash = digest.hexdigest()
+
+    return f"resume_parse_{PARSER_VERSION}_{file_type}_{content_hash}", content_hash
+
+
+def _expiry_cutoff():
+    """Entries last used before this are expired"""
+    return timezone.now() - timedelta(seconds=getattr(settings, 'RESUME_PARSE_CACHE_TIMEOUT', 7 * 24 * 60 * 60))
+
+
+def get_cached_parse(user, uploaded_file):
+    """
+    Return the parse of an identical earlier upload by the same user, or None
+
+    A hit marks the entry as most recently used.
+    """
+    cache_key, content_hash = resume_parse_cache_key(uploaded_file)
+    entry = ResumeParseCacheEntry.objects.filter(
+        user=user,
+        cache_key=cache_key,
+        last_used_at__gte=_expiry_cutoff(),
+    ).first()
+    if entry is None:
+        logger.info(f"Resume parse cache miss: {content_hash[:12]}")
+        return None
+
+    ResumeParseCacheEntry.objects.filter(pk=entry.pk).update(last_used_at=timezone.now())
+    logger.info(f"Resume parse cache hit: {content_hash[:12]}")
+    return entry.parsed_data
+
+
+def cache_parse(user, uploaded_file, parsed_data):
+    """
+    Store the parse of an upload, then evict expired entries and, past
+    RESUME_PARSE_CACHE_MAX_ENTRIES, the least recently used ones
+    """
+    cache_key, _ = resume_parse_cache_key(uploaded_file)
+    ResumeParseCacheEntry.objects.update_or_create(
+        user=user,
+        cache_key=cache_key,
+        defaults={
+            # Timings describe one parse only, so they are not cached
+            'parsed_data': {key: value for key, value in parsed_data.items() if key != 'parse_metrics'},
+            'last_used_at': timezone.now(),
+        },
+    )
+
+    ResumeParseCacheEntry.objects.filter(last_used_at__lt=_expiry_cutoff()).delete()
+    max_entries = getattr(settings, 'RESUME_PARSE_CACHE_MAX_ENTRIES', 500)
+    evicted = list(
+        ResumeParseCacheEntry.objects.order_by('-last_used_at', '-pk').values_list('pk', flat=True)[max_entries:]
+    )
+    if evicted:
+        ResumeParseCacheEntry.objects.filter(pk__in=evicted).delete()
+        logger.info(f"Evicted {len(evicted)} least recently used resume parse(s)")
+
+
+def clear_cached_parses(user):
+    """Forget every cached parse of a user's uploads"""
+    ResumeParseCacheEntry.objects.filter(user=user).delete()
@@ -0,0 +1,136 @@
+"""
+Resume Parser Metrics
+Per-stage wall time and memory for sampled parses, aggregated into
+histograms that can be scraped in the Prometheus text format
+"""
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MEMORY_BUCKETS = (64 * 1024, 256 * 1024, 1024 ** 2, 4 * 1024 ** 2, 16 * 1024 ** 2, 64 * 1024 ** 2)
+
+
+class Histogram:
+    """Fixed-bucket histogram with a running sum and count"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self):
+        """Return (upper bound, cumulative count) pairs ending with +Inf"""
+        total = 0
+        pairs = []
+        for bound, count in zip(list(self.buckets) + ['+Inf'], self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+# Process-wide histograms per parse stage
+_stage_seconds = {}
+_stage_memory = {}
+_lock = threading.Lock()
+
+
+def observe_stage(stage, seconds, memory_peak_bytes=None):
+    """Add one stage measurement to the process-wide histograms"""
+    with _lock:
+        _stage_seconds.setdefault(stage, Histogram(SECONDS_BUCKETS)).observe(seconds)
+        if memory_peak_bytes is not None:
+            _stage_memory.setdefault(stage, Histogram(MEMORY_BUCKETS)).observe(memory_peak_bytes)
+
+
+def observe_parse_metrics(parse_metrics):
+    """Record the parse_metrics attached to a parse result by another process"""
+    for stage, entry in parse_metrics.items():
+        observe_stage(stage, entry['seconds'], entry.get('memory_peak_bytes'))
+
+
+def _render_histogram(name, help_text, histograms):
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for stage, histogram in sorted(histograms.items()):
+        for bound, count in histogram.cumulative_counts():
+            lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {count}')
+        lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum}')
+        lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+    return lines
+
+
+def render_metrics():
+    """Render all stage histograms in the Prometheus text exposition format"""
+    with _lock:
+        lines = _render_histogram(
+            'resume_parse_stage_seconds', 'Wall time per resume parse stage.', _stage_seconds
+        )
+        lines += _render_histogram(
+            'resume_parse_stage_memory_peak_bytes', 'Peak traced allocation per resume parse stage.', _stage_memory
+        )
+    return '\n'.join(lines) + '\n'
+
+
+class StageTimer:
+    """
+    Times the stages of one resume parse
+
+    A disabled timer does nothing, so unsampled parses pay no overhead.
+    Memory tracking uses tracemalloc, which is process-wide and slow, so it
+    is only meant for sampled parses and may over-count if several threads
+    parse at once.
+    """
+
+    def __init__(self, enabled=False, track_memory=False):
+        self.enabled = enabled
+        self.track_memory = enabled and track_memory
+        self.stages = {}
+        self._started_tracemalloc = False
+
+    def __enter__(self):
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        if self.enabled and exc_type is None:
+            observe_parse_metrics(self.stages)
+        return False
+
+    @contextmanager
+    def stage(self, name, track_memory=True):
+        """
+        Measure the wall time, and optionally peak memory, of one stage
+
+        Stages nested inside another stage, such as the extraction tiers,
+        pass track_memory=False so they do not reset the outer stage's peak.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        track_memory = self.track_memory and track_memory
+        if track_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = {'seconds': time.perf_counter() - start}
+            if track_memory:
+                entry['memory_peak_bytes'] = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+            self.stages[name] = entry
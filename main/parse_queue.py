@@ -0,0 +1,120 @@
+"""
+Resume Parse Queue
+Database-backed queue so uploads are parsed outside the request cycle
+by the run_parse_worker management command
+"""
+import logging
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+
+from main.models import Resume, Skill, ResumeParseJob
+from main.parse_cache import cache_parse
+from main.reverse_match import proficiency_weight
+from main.services import parse_uploaded_resume
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_resume(user, uploaded_file):
+    """Store an uploaded resume as a pending parse job"""
+    return ResumeParseJob.objects.create(
+        user=user,
+        file_name=uploaded_file.name,
+        file_data=b''.join(uploaded_file.chunks()),
+    )
+
+
+def claim_next_job():
+    """
+    Atomically move the oldest pending job to processing
+
+    The claim is a conditional UPDATE, so several workers can poll the
+    same table without picking the same job, on any database backend.
+
+    Returns:
+        The claimed ResumeParseJob, or None if the queue is empty
+    """
+    while True:
+        job = ResumeParseJob.objects.filter(status='pending').only('id').first()
+        if job is None:
+            return None
+
+        claimed = ResumeParseJob.objects.filter(pk=job.pk, status='pending').update(
+            status='processing',
+            started_at=timezone.now(),
+        )
+        if claimed:
+            return ResumeParseJob.objects.get(pk=job.pk)
+
+
+def requeue_stale_jobs(max_age_seconds):
+    """Put jobs left in processing by a crashed worker back in the queue"""
+    cutoff = timezone.now() - timedelta(seconds=max_age_seconds)
+    return ResumeParseJob.objects.filter(status='processing', started_at__lt=cutoff).update(
+        status='pending',
+        started_at=None,
+    )
+
+
+def release_job(job):
+    """Put a claimed job that was never started back in the queue"""
+    ResumeParseJob.objects.filter(pk=job.pk, status='processing').update(status='pending', started_at=None)
+
+
+def parse_job_file(file_name, file_data):
+    """Parse the stored bytes of a job, run inside a worker process"""
+    return parse_uploaded_resume(ContentFile(file_data, name=file_name))
+
+
+def save_parsed_resume(user, parsed_data):
+    """Save parsed resume data and its skills for a user"""
+    with transaction.atomic():
+        # Save or update resume in database
+        resume, created = Resume.objects.get_or_create(user=user)
+
+        resume.full_name = parsed_data.get('full_name', '')
+        resume.email = parsed_data.get('email', '')
+        resume.phone = parsed_data.get('phone', '')
+        resume.skills = parsed_data.get('skills', [])
+        resume.experience = parsed_data.get('experience', [])
+        resume.education = parsed_data.get('education', [])
+        resume.certifications = parsed_data.get('certifications', [])
+        resume.projects = parsed_data.get('projects', [])
+        resume.resume_score = parsed_data.get('resume_score', 0)
+        resume.keyword_insights = parsed_data.get('keyword_insights', [])
+        resume.file_type = parsed_data.get('file_type', '')
+        resume.save()
+
+        # Replace old skills; these rows are the index used by reverse_match
+        Skill.objects.filter(resume=resume).delete()
+        Skill.objects.bulk_create([
+            Skill(
+                resume=resume,
+                name=skill.get('name', ''),
+                proficiency=skill.get('proficiency', 'intermediate'),
+                weight=proficiency_weight(skill.get('proficiency', 'intermediate')),
+            )
+            for skill in parsed_data.get('skills', [])
+        ])
+
+    return resume
+
+
+def complete_job(job, parsed_data=None, error=None):
+    """Record the outcome of a job, saving and caching the resume if parsing succeeded"""
+    if parsed_data:
+        save_parsed_resume(job.user, parsed_data)
+        cache_parse(job.user, ContentFile(bytes(job.file_data), name=job.file_name), parsed_data)
+        job.status = 'done'
+    else:
+        job.status = 'failed'
+        job.error = error or 'Failed to parse resume. Please try again.'
+        logger.error(f"Resume parse job {job.pk} failed: {job.error}")
+
+    # The upload is no longer needed once the job has finished
+    job.file_data = b''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'error', 'file_data', 'finished_at'])
@@ -0,0 +1,232 @@
+"""
+Job Ranking
+Ranks jobs for a resume with BM25 over the skill terms extracted from each
+job at ingest, weighting each resume skill by its proficiency
+"""
+import heapq
+import math
+from collections import Counter
+
+from django.core.cache import cache
+from django.db.models import Avg, Count
+
+from main.models import JobResult, JobSkill
+from main.reverse_match import proficiency_weight
+from main.skill_index import SkillIndex, job_terms
+
+# Bumped whenever scores change for the same inputs
+RANKER_VERSION = 'bm25-1'
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Extra term frequency for a skill that appears in the job title
+TITLE_BOOST = 2
+
+CORPUS_STATS_CACHE_KEY = f'job_corpus_stats_{RANKER_VERSION}'
+CORPUS_STATS_TIMEOUT = 60 * 60
+
+
+class CorpusStats:
+    """Job count, average job length and document frequency per skill"""
+
+    def __init__(self, num_jobs, avg_length, doc_freq):
+        self.num_jobs = num_jobs
+        self.avg_length = avg_length or 1.0
+        self.doc_freq = doc_freq
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        """Statistics of a list of job dicts"""
+        terms = [job_terms(job) for job in jobs]
+        doc_freq = Counter(skill for job in terms for skill in job['skills'])
+        avg_length = sum(job['length'] for job in terms) / len(terms) if terms else 0.0
+        return cls(len(terms), avg_length, dict(doc_freq))
+
+    @classmethod
+    def from_index(cls):
+        """Statistics of the local JobResult index, cached for an hour"""
+        stats = cache.get(CORPUS_STATS_CACHE_KEY)
+        if stats is None:
+            totals = JobResult.objects.aggregate(num_jobs=Count('id'), avg_length=Avg('length'))
+            doc_freq = dict(JobSkill.objects.values('skill').annotate(jobs=Count('id')).values_list('skill', 'jobs'))
+            stats = cls(totals['num_jobs'], totals['avg_length'], doc_freq)
+            cache.set(CORPUS_STATS_CACHE_KEY, stats, CORPUS_STATS_TIMEOUT)
+        return stats
+
+    @classmethod
+    def for_candidates(cls, jobs):
+        """Index statistics, or those of the candidates while the index is empty"""
+        stats = cls.from_index()
+        return stats if stats.num_jobs else cls.from_jobs(jobs)
+
+    def idf(self, skill):
+        df = self.doc_freq.get(skill, 0)
+        return math.log(1 + (self.num_jobs - df + 0.5) / (df + 0.5))
+
+
+class BM25Ranker:
+    """
+    Scores jobs for a resume
+
+    The relevance used for ordering is BM25 over skill mentions, with
+    title mentions boosted and each resume skill weighted by proficiency.
+    The match_score shown to users is the share of the resume's
+    proficiency-weighted skills that the job mentions, from 0 to 100; it
+    leaves out IDF so a skill every job asks for still counts as a match.
+    """
+
+    def __init__(self, stats, k1=BM25_K1, b=BM25_B):
+        self.stats = stats
+        self.k1 = k1
+        self.b = b
+
+    def query_weights(self, resume_skills):
+        """Map each resume skill name to its proficiency weight"""
+        weights = {}
+        for skill in resume_skills:
+            name = skill.get('name', '').lower()
+            if name:
+                weights[name] = max(weights.get(name, 0.0), proficiency_weight(skill.get('proficiency')))
+        return weights
+
+    def length_norm(self, length):
+        """BM25 length normalization of a job with this many words"""
+        return self.k1 * (1 - self.b + self.b * length / self.stats.avg_length)
+
+    def term_weight(self, skill, tf, in_title, length_norm):
+        """BM25 weight of a skill mentioned tf times by a job, before proficiency"""
+        if in_title:
+            tf += TITLE_BOOST
+        return self.stats.idf(skill) * tf * (self.k1 + 1) / (tf + length_norm)
+
+    def relevance(self, job, weights):
+        """
+        Score one job against query_weights of a resume
+
+        Returns:
+            Tuple of (relevance, match_score)
+        """
+        terms = job_terms(job)
+        skill_counts = terms['skill_counts']
+        title_skills = terms['title_skills']
+        length_norm = self.length_norm(terms['length'])
+
+        relevance = 0.0
+        matched_weight = 0.0
+        total_weight = 0.0
+        for skill, weight in weights.items():
+            total_weight += weight
+
+            tf = skill_counts.get(skill, 0)
+            if not tf:
+                continue
+            relevance += weight * self.term_weight(skill, tf, skill in title_skills, length_norm)
+            matched_weight += weight
+
+        match_score = round(100 * matched_weight / total_weight) if total_weight else 0
+        return relevance, match_score
+
+    def matching_skills(self, job, weights):
+        """Resume skills the job mentions, sorted"""
+        return sorted(skill for skill in job_terms(job)['skill_counts'] if skill in weights)
+
+    def score(self, job, weights):
+        """
+        Score one job and list the skills it matched
+
+        Returns:
+            Tuple of (relevance, match_score, matching_skills)
+        """
+        relevance, match_score = self.relevance(job, weights)
+        return relevance, match_score, self.matching_skills(job, weights)
+
+
+class RankedJobs:
+    """
+    Jobs ranked for a resume, evaluated lazily for pagination
+
+    Candidates come from the posting lists of the resume's skills and get
+    only their numeric scores computed, once. Slicing selects the
+    requested window with a heap instead of sorting every candidate, and
+    only the jobs in that window get relevance, match_score and
+    matching_skills set. Paginator can page through it directly, since it
+    supports len() and slicing.
+    """
+
+    def __init__(self, jobs, resume_skills, stats=None, min_score=0, job_type=None):
+        """
+        Args:
+            jobs: Candidate job dicts
+            resume_skills: List of skill objects
+            stats: CorpusStats for IDF, defaults to the local index
+            min_score: Leave out jobs with a lower match_score
+            job_type: Only keep jobs of this employment type, e.g. FULLTIME
+        """
+        self.jobs = jobs
+        self.resume_skills = resume_skills
+        self.stats = stats
+        self.min_score = min_score or 0
+        self.job_type = job_type
+        self._scored = None
+
+    def filter(self, min_score=0, job_type=None):
+        """Return the same ranking restricted by match_score and job type"""
+        return RankedJobs(self.jobs, self.resume_skills, self.stats, min_score, job_type)
+
+    def _score_candidates(self):
+        """Compute (relevance, -position, match_score) per kept candidate, once"""
+        if self._scored is None:
+            self._scored = []
+            if not self.jobs:
+                return self._scored
+
+            self.ranker = BM25Ranker(self.stats or CorpusStats.for_candidates(self.jobs))
+            self.weights = self.ranker.query_weights(self.resume_skills)
+
+            for position in SkillIndex(self.jobs).candidates(self.resume_skills):
+                job = self.jobs[position]
+                if self.job_type and (job.get('job_type') or '').upper() != self.job_type:
+                    continue
+                relevance, match_score = self.ranker.relevance(job, self.weights)
+                if match_score >= self.min_score:
+                    # -position keeps equally relevant jobs in their fetched order
+                    self._scored.append((relevance, -position, match_score))
+        return self._scored
+
+    def _annotate(self, entries):
+        jobs = []
+        for relevance, negative_position, match_score in entries:
+            job = self.jobs[-negative_position]
+            job['relevance'] = relevance
+            job['match_score'] = match_score
+            job['matching_skills'] = self.ranker.matching_skills(job, self.weights)
+            jobs.append(job)
+        return jobs
+
+    def entries(self, limit):
+        """(job_id, relevance, match_score) of the top limit jobs, best first"""
+        return [
+            (self.jobs[-negative_position].get('job_id'), relevance, match_score)
+            for relevance, negative_position, match_score in heapq.nlargest(limit, self._score_candidates())
+        ]
+
+    def __len__(self):
+        return len(self._score_candidates())
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError('RankedJobs index out of range')
+            return self[key:key + 1][0]
+
+        start, stop, step = key.indices(len(self))
+        if start >= stop:
+            return []
+        top = heapq.nlargest(stop, self._score_candidates())
+        return self._annotate(top[start:stop:step])
+
+    def __iter__(self):
+        return iter(self[:])
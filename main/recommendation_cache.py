@@ -0,0 +1,147 @@
+"""
+Recommendation Cache
+Keeps each resume's ranked, filtered job ids in the cache so later pages of
+job recommendations are one cache read plus one JobResult query, instead of
+another search and a full rescore
+"""
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from main.job_api import get_recommended_jobs
+from main.job_cache import canonical_location
+from main.job_index import job_to_dict
+from main.models import JobResult
+from main.ranking import RANKER_VERSION, BM25Ranker
+
+logger = logging.getLogger(__name__)
+
+# Ranked jobs kept per resume, enough for the first pages of results
+RECOMMENDATION_CACHE_SIZE = 200
+
+
+def recommendation_cache_key(resume, location=None, job_type=None, min_score=0):
+    """
+    Cache key for the recommendations of a resume under the given filters
+
+    The key covers the resume's skills and updated_at, so re-uploading a
+    resume moves it to a new key, and RANKER_VERSION, so scoring changes
+    never serve old rankings. Entries left behind simply expire.
+    """
+    content = json.dumps([
+        resume.skills,
+        resume.updated_at.isoformat() if resume.updated_at else '',
+        canonical_location(location),
+        job_type or '',
+        min_score or 0,
+        RANKER_VERSION,
+    ], sort_keys=True, default=str)
+    digest = hashlib.sha256(content.encode()).hexdigest()[:24]
+    return f"recommendations_{resume.pk}_{digest}"
+
+
+class CachedRecommendations:
+    """
+    A cached ranking that loads only the requested slice from JobResult
+
+    Supports len() and slicing like RankedJobs, so Paginator can page
+    through it directly. Only the top RECOMMENDATION_CACHE_SIZE jobs are
+    cached; a slice reaching past them reruns the ranking through rank.
+    """
+
+    def __init__(self, entries, total, resume_skills, rank):
+        """
+        Args:
+            entries: (job_id, relevance, match_score) tuples, best first
+            total: Number of jobs in the full ranking
+            resume_skills: List of skill objects
+            rank: Callable returning the full RankedJobs, for deep pages
+        """
+        self.entries = entries
+        self.total = total
+        self.weights = BM25Ranker(None).query_weights(resume_skills)
+        self.rank = rank
+        self._ranked = None
+
+    def __len__(self):
+        return self.total
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if key < 0:
+                key += self.total
+            if not 0 <= key < self.total:
+                raise IndexError('CachedRecommendations index out of range')
+            return self[key:key + 1][0]
+
+        start, stop, step = key.indices(self.total)
+        if stop > len(self.entries):
+            if self._ranked is None:
+                self._ranked = self.rank()
+            return self._ranked[key]
+        return self._load(self.entries[start:stop:step])
+
+    def _load(self, window):
+        job_results = JobResult.objects.filter(
+            job_id__in=[job_id for job_id, _, _ in window]
+        ).prefetch_related('skill_postings')
+        by_id = {job_result.job_id: job_result for job_result in job_results}
+
+        jobs = []
+        for job_id, relevance, match_score in window:
+            if job_id not in by_id:
+                # Removed from the index since it was ranked
+                logger.warning(f"Cached recommendation {job_id} is no longer indexed")
+                continue
+            job = job_to_dict(by_id[job_id])
+            job['relevance'] = relevance
+            job['match_score'] = match_score
+            job['matching_skills'] = sorted(skill for skill in job['skill_counts'] if skill in self.weights)
+            jobs.append(job)
+        return jobs
+
+    def __iter__(self):
+        return iter(self[:])
+
+
+def get_cached_recommendations(resume, api_key=None, location=None, job_type=None, min_score=0):
+    """
+    Recommended jobs for a resume, ranked once and then served from the cache
+
+    On a miss the jobs are searched and ranked as usual, and the top
+    RECOMMENDATION_CACHE_SIZE job ids are picked with a heap and cached,
+    along with the total, if those jobs are all in the local index. Empty
+    rankings are cached too. Rankings that include jobs only held in
+    memory, such as mock fallback jobs, are not cached.
+
+    Returns:
+        RankedJobs on a miss, CachedRecommendations on a hit
+    """
+    def rank():
+        return get_recommended_jobs(resume.skills, api_key, location).filter(
+            min_score=min_score,
+            job_type=job_type
+        )
+
+    key = recommendation_cache_key(resume, location, job_type, min_score)
+    cached = cache.get(key)
+    if cached is not None:
+        return CachedRecommendations(cached['entries'], cached['total'], resume.skills, rank)
+
+    ranked = rank()
+    entries = ranked.entries(RECOMMENDATION_CACHE_SIZE)
+
+    job_ids = {job_id for job_id, _, _ in entries}
+    indexed = JobResult.objects.filter(job_id__in=job_ids).count() if job_ids and None not in job_ids else 0
+    if indexed == len(job_ids):
+        cache.set(
+            key,
+            {'entries': entries, 'total': len(ranked)},
+            getattr(settings, 'JSEARCH_RECOMMENDATION_TTL', 15 * 60)
+        )
+    else:
+        logger.info(f"Not caching recommendations for resume {resume.pk}: {len(job_ids) - indexed} job(s) not indexed")
+    return ranked
@@ -0,0 +1,99 @@
+"""
+Reverse Job Matching
+Finds the best-matching stored resumes for a job through the Skill table,
+which acts as an inverted index from skill name to resumes
+"""
+from collections import defaultdict
+
+from django.db.models import Case, F, FloatField, Sum, When
+
+from main.models import Resume, Skill
+from main.skill_index import job_skills
+
+# Skill.weight per proficiency level
+PROFICIENCY_WEIGHTS = {
+    'beginner': 1.0,
+    'intermediate': 1.5,
+    'advanced': 2.0,
+    'expert': 2.5,
+}
+
+# Multiplier for skills that also appear in the job title
+TITLE_WEIGHT = 1.5
+
+
+def proficiency_weight(proficiency):
+    """Numeric weight of a proficiency level, 1.0 if unknown"""
+    return PROFICIENCY_WEIGHTS.get((proficiency or '').lower(), 1.0)
+
+
+def top_resumes_for_job(job, k=10):
+    """
+    Rank stored resumes for a job
+
+    Each resume scores the sum of the weights of its skills that the job
+    mentions, with title skills counting TITLE_WEIGHT times. The ranking is
+    one aggregate query over the (name, resume, weight) index on Skill,
+    which covers the query, so only resumes sharing a skill with the job
+    are touched and the table itself is not read. Skill rows are
+    rewritten when a resume is uploaded or cleared, so the index is always
+    current.
+
+    Args:
+        job: Job dict, as returned by JobSearchAPI
+        k: Number of resumes to return
+
+    Returns:
+        List of (resume, score, matching_skills), best first
+    """
+    skills, title_skills = job_skills(job)
+    if not skills:
+        return []
+
+    # Resume skill names are stored upper-cased by the parser
+    names = [skill.upper() for skill in skills]
+    title_names = [skill.upper() for skill in title_skills]
+
+    ranked = list(
+        Skill.objects.filter(name__in=names)
+        .values('resume_id')
+        .annotate(score=Sum(Case(
+            When(name__in=title_names, then=F('weight') * TITLE_WEIGHT),
+            default=F('weight'),
+            output_field=FloatField(),
+        )))
+        .order_by('-score', 'resume_id')[:k]
+    )
+    if not ranked:
+        return []
+
+    resume_ids = [row['resume_id'] for row in ranked]
+    resumes = Resume.objects.select_related('user').in_bulk(resume_ids)
+    matching_skills = defaultdict(list)
+    for resume_id, name in Skill.objects.filter(resume_id__in=resume_ids, name__in=names).values_list(
+        'resume_id', 'name'
+    ).order_by('name'):
+        matching_skills[resume_id].append(name.lower())
+
+    return [(resumes[row['resume_id']], row['score'], matching_skills[row['resume_id']]) for row in ranked]
+
+
+def build_job_alert_digests(jobs, k=10):
+    """
+    Group new jobs by the users they suit best, for job alert digests
+
+    Args:
+        jobs: Job dicts to announce
+        k: Candidates considered per job
+
+    Returns:
+        Dict of user to a list of (job, score), best first
+    """
+    digests = defaultdict(list)
+    for job in jobs:
+        for resume, score, _ in top_resumes_for_job(job, k=k):
+            digests[resume.user].append((job, score))
+
+    for entries in digests.values():
+        entries.sort(key=lambda entry: entry[1], reverse=True)
+    return dict(digests)
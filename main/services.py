@@ -2,29 +2,140 @@
 Resume Parsing Service
 Extracts information from PDF and DOCX files using NLP
 """
+import io
+import logging
 import os
+import random
 import re
 import string
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from docx import Document
-import spacy
-from nltk.corpus import stopwords
-import nltk
 import PyPDF2
+from django.conf import settings
 
-# Download NLTK data if not already present
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+from main.parse_metrics import StageTimer
+from main.skill_matcher import SkillMatcher
+from main.stopwords import ENGLISH_STOP_WORDS
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading spaCy model...")
-    os.system("python -m spacy download en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+logger = logging.getLogger(__name__)
+
+# Bump whenever parser output changes so cached results are not reused
+PARSER_VERSION = '5'
+
+# Uploads up to this size are parsed straight from the upload object,
+# larger ones are spooled to a temporary file
+IN_MEMORY_PARSE_LIMIT = 5 * 1024 * 1024
+
+# Pipeline components ResumeParser never reads. The NER component in
+# en_core_web_sm has its own tok2vec layer, so the shared one can go too.
+SPACY_EXCLUDED_COMPONENTS = ['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter']
+
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    """Load the spaCy model on first use, keeping only tokenizer and NER"""
+    import spacy
+    
+    try:
+        return spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDED_COMPONENTS)
+    except OSError as e:
+        raise OSError(
+            "spaCy model 'en_core_web_sm' is not installed. "
+            "Run: python -m spacy download en_core_web_sm"
+        ) from e
+
+
+# Process pools shared by parallel PDF extraction, by worker count
+_page_pools = {}
+_page_pools_lock = threading.Lock()
+
+
+def get_page_pool(n_workers=None):
+    """Process pool shared by parallel PDF extraction, created on first use"""
+    with _page_pools_lock:
+        if n_workers not in _page_pools:
+            _page_pools[n_workers] = ProcessPoolExecutor(max_workers=n_workers)
+        return _page_pools[n_workers]
+
+
+def reset_page_pool(pool):
+    """Drop a broken page pool, so the next parallel extraction starts a new one"""
+    with _page_pools_lock:
+        for n_workers, page_pool in list(_page_pools.items()):
+            if page_pool is pool:
+                del _page_pools[n_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@contextmanager
+def open_resume_source(source):
+    """Yield a readable binary stream for a path, bytes-like or file-like source"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield io.BytesIO(source)
+    elif hasattr(source, 'read'):
+        source.seek(0)
+        yield source
+    else:
+        with open(source, 'rb') as file:
+            yield file
+
+
+def _extract_pdf_page_range(source, start, stop):
+    """Extract the text of pages [start, stop) of a PDF in a worker process"""
+    with open_resume_source(source) as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [pdf_reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _compile_section_pattern(section_headings):
+    """Compile heading lines into one pattern with a named group per section"""
+    groups = '|'.join(
+        f"(?P<{name}>{'|'.join(re.escape(heading) for heading in headings)})"
+        for name, headings in section_headings.items()
+    )
+    return re.compile(rf'^[ \t]*(?:{groups})[ \t]*:?[ \t]*$', re.MULTILINE)
+
+
+def _compile_sentence_patterns(keywords):
+    """Compile one 'keyword ... .' pattern per keyword, keeping keyword order"""
+    return [(keyword, re.compile(rf'{re.escape(keyword)}[^.]*\.')) for keyword in keywords]
+
+
+class ResumeSections:
+    """
+    Lowercased resume text segmented once into headed sections
+    
+    offsets maps a section name to the (start, end) of its body in
+    text_lower. A section runs from its heading to the next heading.
+    """
+    
+    def __init__(self, text, section_pattern):
+        self.text_lower = text.lower()
+        self.offsets = {}
+        
+        headings = list(section_pattern.finditer(self.text_lower))
+        for heading, next_heading in zip(headings, headings[1:] + [None]):
+            end = next_heading.start() if next_heading else len(self.text_lower)
+            self.offsets.setdefault(heading.lastgroup, (heading.end(), end))
+    
+    def has(self, name):
+        """Check whether a section heading was found"""
+        return name in self.offsets
+    
+    def get(self, name):
+        """Return the section body, or the whole text if there is no such heading"""
+        if name not in self.offsets:
+            return self.text_lower
+        start, end = self.offsets[name]
+        return self.text_lower[start:end]
 
 
 class ResumeParser:
@@ -41,81 +152,338 @@ class ResumeParser:
         'soft': ['communication', 'leadership', 'teamwork', 'problem-solving', 'critical thinking'],
     }
     
+    SKILL_MATCHER = SkillMatcher(COMMON_SKILLS)
+    
     # Email pattern
-    EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
     
     # Phone pattern (basic)
-    PHONE_PATTERN = r'(?:\+?\d{1,3}[-.\s]?)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})'
+    PHONE_PATTERN = re.compile(r'(?:\+?\d{1,3}[-.\s]?)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})')
+    
+    # Section headings, matched as whole lines
+    SECTION_HEADINGS = {
+        'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                       'employment history', 'work history'],
+        'education': ['education', 'academic background', 'academic qualifications', 'qualifications'],
+        'projects': ['projects', 'personal projects', 'academic projects', 'key projects'],
+        'certifications': ['certifications', 'certificates', 'licenses and certifications'],
+        'skills': ['skills', 'technical skills', 'key skills'],
+    }
+    SECTION_PATTERN = _compile_section_pattern(SECTION_HEADINGS)
+    
+    # Top of the resume searched first for name and contact details
+    HEADER_ZONE_CHARS = 500
+    HEADER_NAME_LINES = 5
+    NAME_LINE_PATTERN = re.compile(r"[A-Za-z][A-Za-z.'-]*(?: [A-Za-z][A-Za-z.'-]*){1,3}")
+    # Header lines with any of these words are titles or headings, not names,
+    # e.g. "SOFTWARE ENGINEER" above or below the candidate's name
+    NOT_NAME_WORDS = {
+        'resume', 'curriculum', 'vitae', 'cv', 'profile', 'contact', 'summary', 'objective',
+        'experience', 'education', 'skills', 'projects', 'certifications',
+        'engineer', 'developer', 'programmer', 'architect', 'manager', 'director', 'lead',
+        'analyst', 'consultant', 'designer', 'scientist', 'specialist', 'administrator',
+        'technician', 'intern', 'student', 'graduate', 'associate', 'executive', 'officer',
+        'senior', 'junior', 'principal', 'staff', 'software', 'data', 'web', 'full', 'stack',
+        'frontend', 'backend', 'devops', 'cloud', 'machine', 'learning',
+    }
+    NAME_WORD_SEPARATOR = re.compile(r"[\s.'-]+")
+    
+    # Keyword patterns used by the section extractors
+    EXPERIENCE_PATTERN = re.compile(r'experience|employment|worked')
+    EDUCATION_KEYWORDS = ['degree', 'bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'bsc', 'msc', 'university', 'college']
+    EDUCATION_PATTERNS = _compile_sentence_patterns(EDUCATION_KEYWORDS)
+    CERTIFICATION_KEYWORDS = ['certification', 'certified', 'aws', 'azure', 'gcp', 'cisco', 'comptia', 'pmp', 'prince2']
+    CERTIFICATION_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in CERTIFICATION_KEYWORDS))
+    PROJECT_KEYWORDS = ['project', 'built', 'developed', 'created', 'implemented']
+    PROJECT_PATTERNS = _compile_sentence_patterns(PROJECT_KEYWORDS)
+    
+    # Extraction budget so a pathological upload cannot tie up a worker
+    MAX_PDF_PAGES = 30
+    MAX_TEXT_CHARS = 100000
+    
+    # Consecutive pages without text before a PDF is treated as scanned
+    MAX_EMPTY_PAGES = 3
+    
+    # Opt-in parallel extraction: PDFs with at least this many pages are
+    # split into page ranges and extracted across a process pool. The
+    # serial page budget would stop at MAX_PDF_PAGES, so parsers with
+    # parallel_pages on default to MAX_PARALLEL_PDF_PAGES instead;
+    # MAX_TEXT_CHARS still caps the text kept.
+    PARALLEL_PAGE_THRESHOLD = 20
+    PAGES_PER_TASK = 10
+    MAX_PARALLEL_PDF_PAGES = 200
     
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, max_pages=None, max_chars=None, parallel_pages=False, n_workers=None,
+                 metrics_sample_rate=None, track_memory=None):
+        self.stop_words = ENGLISH_STOP_WORDS
+        self.max_pages = max_pages or (self.MAX_PARALLEL_PDF_PAGES if parallel_pages else self.MAX_PDF_PAGES)
+        self.max_chars = max_chars or self.MAX_TEXT_CHARS
+        self.parallel_pages = parallel_pages
+        self.n_workers = n_workers
+        
+        # Share of parses that record per-stage timings (0 disables)
+        if metrics_sample_rate is None:
+            metrics_sample_rate = getattr(settings, 'RESUME_PARSE_METRICS_SAMPLE_RATE', 0.0)
+        if track_memory is None:
+            track_memory = getattr(settings, 'RESUME_PARSE_METRICS_TRACK_MEMORY', False)
+        self.metrics_sample_rate = metrics_sample_rate
+        self.track_memory = track_memory
     
-    def extract_text_from_docx(self, file_path):
-        """Extract text from DOCX file"""
+    def extract_text_from_docx(self, source):
+        """Extract text from a DOCX path, bytes or file-like object"""
         try:
-            doc = Document(file_path)
+            with open_resume_source(source) as file:
+                doc = Document(file)
             text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-            return text
+            return text[:self.max_chars]
         except Exception as e:
             print(f"Error reading DOCX: {e}")
             return ""
     
-    def extract_text_from_pdf(self, file_path):
-        """Extract text from PDF file"""
+    def within_budget(self, page_texts):
+        """
+        Yield page texts until the character budget is spent
+        
+        Stops early after MAX_EMPTY_PAGES pages in a row without text, so
+        scanned or garbage PDFs are abandoned after a few pages.
+        """
+        remaining_chars = self.max_chars
+        empty_pages = 0
+        
+        for page_text in page_texts:
+            if not page_text.strip():
+                empty_pages += 1
+                if empty_pages >= self.MAX_EMPTY_PAGES:
+                    break
+                continue
+            empty_pages = 0
+            
+            yield page_text[:remaining_chars]
+            remaining_chars -= len(page_text)
+            if remaining_chars <= 0:
+                break
+    
+    def iter_pdf_pages(self, source):
+        """Yield PDF text page by page within the page and character budget"""
+        with open_resume_source(source) as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            pages = islice(pdf_reader.pages, self.max_pages)
+            yield from self.within_budget(page.extract_text() or "" for page in pages)
+    
+    def iter_pdf_pages_parallel(self, source, page_count):
+        """
+        Yield PDF text page by page, extracting page ranges in the page pool
+        
+        Ranges are submitted lazily, one per worker ahead of the page being
+        read, so once the caller stops at its budget only the ranges in
+        flight are wasted and the rest are cancelled. In-memory sources are
+        sent to the workers as bytes. A broken pool is dropped before the
+        error is raised, so the next parse starts a new one.
+        """
+        if not isinstance(source, (str, os.PathLike)):
+            with open_resume_source(source) as file:
+                source = file.read()
+        
+        pool = get_page_pool(self.n_workers)
+        window = self.n_workers or os.cpu_count() or 1
+        starts = iter(range(0, page_count, self.PAGES_PER_TASK))
+        pending = deque()
+        
+        def submit(start):
+            stop = min(start + self.PAGES_PER_TASK, page_count)
+            pending.append(pool.submit(_extract_pdf_page_range, source, start, stop))
+        
         try:
-            text = ""
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-            return text
+            for start in islice(starts, window):
+                submit(start)
+            while pending:
+                page_texts = pending.popleft().result()
+                for start in islice(starts, 1):
+                    submit(start)
+                yield from page_texts
+        except BrokenProcessPool:
+            reset_page_pool(pool)
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def extract_text_from_pdf(self, source):
+        """
+        Extract text from a PDF path, bytes or file-like object
+        
+        Long PDFs are read in parallel when parallel_pages is set. If a page
+        worker dies, the file is read again serially.
+        """
+        try:
+            if self.parallel_pages:
+                with open_resume_source(source) as file:
+                    page_count = min(len(PyPDF2.PdfReader(file).pages), self.max_pages)
+                if page_count >= self.PARALLEL_PAGE_THRESHOLD:
+                    pages = self.iter_pdf_pages_parallel(source, page_count)
+                    try:
+                        return '\n'.join(self.within_budget(pages))
+                    except BrokenProcessPool:
+                        logger.warning("A PDF page worker died, extracting the file serially")
+                    finally:
+                        # Cancels the ranges not yet started
+                        pages.close()
+            
+            return '\n'.join(self.iter_pdf_pages(source))
         except Exception as e:
             print(f"Error reading PDF: {e}")
             return ""
     
-    def parse_resume(self, file_path):
-        """Main method to parse resume"""
-        file_ext = Path(file_path).suffix.lower()
+    def extract_text(self, source, file_type=None):
+        """
+        Extract raw text and file type from a resume
+        
+        Args:
+            source: File path, bytes/memoryview or binary file-like object
+            file_type: 'pdf' or 'docx', taken from the path or file name if omitted
+        """
+        if file_type is None:
+            name = getattr(source, 'name', source)
+            if isinstance(name, (str, os.PathLike)):
+                file_type = Path(name).suffix.lower().lstrip('.')
+        
+        if file_type == 'docx':
+            return self.extract_text_from_docx(source), 'docx'
+        elif file_type == 'pdf':
+            return self.extract_text_from_pdf(source), 'pdf'
+        
+        return "", None
+    
+    def parse_resume(self, source, file_type=None):
+        """
+        Main method to parse resume from a path, bytes or file-like object
+        
+        Sampled parses get a 'parse_metrics' entry mapping each stage to its
+        wall time, plus peak memory when memory tracking is on.
+        """
+        timer = StageTimer(
+            enabled=random.random() < self.metrics_sample_rate,
+            track_memory=self.track_memory,
+        )
+        
+        with timer:
+            with timer.stage('extract_text'):
+                text, file_type = self.extract_text(source, file_type)
+            
+            if not text:
+                return None
+            
+            # spaCy only runs on the parts of the text that need it
+            parsed_data = self.build_parsed_data(text, file_type, timer=timer)
         
-        if file_ext == '.docx':
-            text = self.extract_text_from_docx(file_path)
-            file_type = 'docx'
-        elif file_ext == '.pdf':
-            text = self.extract_text_from_pdf(file_path)
-            file_type = 'pdf'
-        else:
-            return None
+        if timer.enabled:
+            parsed_data['parse_metrics'] = timer.stages
+        
+        return parsed_data
+    
+    def index_sections(self, text):
+        """Lowercase and segment the resume once for all extractors"""
+        return ResumeSections(text, self.SECTION_PATTERN)
+    
+    def build_parsed_data(self, text, file_type, doc=None, timer=None):
+        """
+        Run all extractors over already extracted text
         
-        if not text:
-            return None
+        doc is an optional spaCy Doc of the full cased text, as produced by
+        nlp.pipe in batch parsing. Without it, NER runs only on the header
+        zone or experience section when a cheaper tier cannot answer.
+        timer is an optional StageTimer that times each extractor.
+        """
+        timer = timer or StageTimer()
         
-        # Process with spaCy
-        doc = nlp(text.lower())
+        with timer.stage('index_sections'):
+            sections = self.index_sections(text)
         
         parsed_data = {
-            'full_name': self.extract_name(text, doc),
-            'email': self.extract_email(text),
-            'phone': self.extract_phone(text),
-            'skills': self.extract_skills(text),
-            'experience': self.extract_experience(text, doc),
-            'education': self.extract_education(text, doc),
-            'certifications': self.extract_certifications(text, doc),
-            'projects': self.extract_projects(text, doc),
             'file_type': file_type,
             'raw_text': text[:1000],  # Store first 1000 chars for reference
         }
+        with timer.stage('extract_name'):
+            parsed_data['full_name'] = self.extract_name(text, doc, timer=timer)
+        with timer.stage('extract_email'):
+            parsed_data['email'] = self.extract_email(text)
+        with timer.stage('extract_phone'):
+            parsed_data['phone'] = self.extract_phone(text)
+        with timer.stage('extract_skills'):
+            parsed_data['skills'] = self.extract_skills(text, sections)
+        with timer.stage('extract_experience'):
+            parsed_data['experience'] = self.extract_experience(text, doc, sections, timer=timer)
+        with timer.stage('extract_education'):
+            parsed_data['education'] = self.extract_education(text, doc, sections)
+        with timer.stage('extract_certifications'):
+            parsed_data['certifications'] = self.extract_certifications(text, doc, sections)
+        with timer.stage('extract_projects'):
+            parsed_data['projects'] = self.extract_projects(text, doc, sections)
         
         # Calculate resume score
-        parsed_data['resume_score'] = self.calculate_resume_score(parsed_data)
-        parsed_data['keyword_insights'] = self.extract_keyword_insights(text)
+        with timer.stage('calculate_resume_score'):
+            parsed_data['resume_score'] = self.calculate_resume_score(parsed_data)
+        with timer.stage('extract_keyword_insights'):
+            parsed_data['keyword_insights'] = self.extract_keyword_insights(text, sections)
         
         return parsed_data
     
-    def extract_name(self, text, doc):
-        """Extract full name from resume"""
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                return ent.text.title()
+    def find_entity(self, text, label, tier, doc=None, end_char=None, timer=None):
+        """
+        Return the first entity with a label, timing the NER tier
+        
+        Uses doc when given, limited to entities starting before end_char,
+        otherwise runs spaCy over text. The tier is timed as the stage
+        tier_<tier> of timer.
+        """
+        timer = timer or StageTimer()
+        
+        with timer.stage(f'tier_{tier}', track_memory=False):
+            if doc is None:
+                doc = get_nlp()(text)
+            
+            for ent in doc.ents:
+                if ent.label_ == label and (end_char is None or ent.start_char < end_char):
+                    return ent.text
+        
+        return None
+    
+    def name_from_header(self, header, timer=None):
+        """
+        Cheapest tier: take the first header line that looks like a name
+        
+        Lines with a job title or heading word are skipped, so a title line
+        above the name is never taken for it.
+        """
+        timer = timer or StageTimer()
+        
+        with timer.stage('tier_header_rules', track_memory=False):
+            lines = [line.strip() for line in header.split('\n') if line.strip()]
+            for line in lines[:self.HEADER_NAME_LINES]:
+                words = self.NAME_WORD_SEPARATOR.split(line.lower())
+                if self.NOT_NAME_WORDS.intersection(words) or self.SECTION_PATTERN.fullmatch(line.lower()):
+                    continue
+                if self.NAME_LINE_PATTERN.fullmatch(line):
+                    return line.title() if line.isupper() or line.islower() else line
+        
+        return None
+    
+    def header_zone(self, text):
+        """Return the cased top of the resume, ending on a line boundary"""
+        header_end = text.find('\n', self.HEADER_ZONE_CHARS)
+        return text if header_end == -1 else text[:header_end]
+    
+    def extract_name(self, text, doc=None, timer=None):
+        """Extract full name, trying the header zone before full-document NER"""
+        header = self.header_zone(text)
+        
+        name = (
+            self.name_from_header(header, timer)
+            or self.find_entity(header, "PERSON", 'header_ner', doc, end_char=len(header), timer=timer)
+            or self.find_entity(text, "PERSON", 'full_ner', doc, timer=timer)
+        )
+        if name:
+            return name.title() if name.islower() else name
         
         # Fallback: First line might be name
         first_line = text.split('\n')[0].strip()
@@ -124,39 +492,44 @@ class ResumeParser:
         
         return "Not Found"
     
+    def search_header_first(self, pattern, text):
+        """Search the header zone first and only scan the full text on a miss"""
+        return pattern.search(self.header_zone(text)) or pattern.search(text)
+    
     def extract_email(self, text):
         """Extract email address"""
-        matches = re.findall(self.EMAIL_PATTERN, text)
-        return matches[0] if matches else "Not Found"
+        match = self.search_header_first(self.EMAIL_PATTERN, text)
+        return match.group(0) if match else "Not Found"
     
     def extract_phone(self, text):
         """Extract phone number"""
-        matches = re.findall(self.PHONE_PATTERN, text)
-        if matches:
-            return f"+{matches[0][0]}-{matches[0][1]}-{matches[0][2]}"
+        match = self.search_header_first(self.PHONE_PATTERN, text)
+        if match:
+            return f"+{match.group(1)}-{match.group(2)}-{match.group(3)}"
         return "Not Found"
     
-    def extract_skills(self, text):
+    def extract_skills(self, text, sections=None):
         """Extract skills from resume"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        for category, skills in self.COMMON_SKILLS.items():
-            for skill in skills:
-                if skill in text_lower:
-                    found_skills.append({
-                        'name': skill.upper(),
-                        'category': category,
-                        'proficiency': self.estimate_proficiency(text_lower, skill)
-                    })
-        
-        return list({skill['name']: skill for skill in found_skills}.values())
+        sections = sections or self.index_sections(text)
+        skill_counts = self.SKILL_MATCHER.count(sections.text_lower)
+        
+        return [
+            {
+                'name': skill.upper(),
+                'category': self.SKILL_MATCHER.categories[skill],
+                'proficiency': self.proficiency_from_count(count)
+            }
+            for skill, count in skill_counts.items()
+        ]
     
     def estimate_proficiency(self, text, skill):
         """Estimate skill proficiency level"""
-        skill_lower = skill.lower()
-        count = text.count(skill_lower)
-        
+        count = self.SKILL_MATCHER.count(text.lower())[skill.lower()]
+        return self.proficiency_from_count(count)
+    
+    @staticmethod
+    def proficiency_from_count(count):
+        """Map number of skill mentions to a proficiency level"""
         if count >= 5:
             return 'Advanced'
         elif count >= 3:
@@ -164,24 +537,28 @@ class ResumeParser:
         else:
             return 'Beginner'
     
-    def extract_experience(self, text, doc):
+    def extract_experience(self, text, doc, sections=None, timer=None):
         """Extract work experience"""
         experience = []
+        sections = sections or self.index_sections(text)
+        timer = timer or StageTimer()
         
         # Look for common experience keywords
-        exp_keywords = ['experience', 'worked', 'employment', 'professional']
-        text_lower = text.lower()
-        
-        sections = re.split(r'(experience|employment|worked)', text_lower, flags=re.IGNORECASE)
-        
-        if len(sections) > 1:
-            exp_section = sections[-1][:1000]  # Take relevant section
-            
-            # Extract companies (usually proper nouns)
-            companies = set()
-            for ent in doc.ents:
-                if ent.label_ == "ORG":
-                    companies.add(ent.text)
+        if sections.has('experience') or self.EXPERIENCE_PATTERN.search(sections.text_lower):
+            # Extract companies (usually proper nouns), running NER over
+            # the cased experience section only when no full doc is given
+            with timer.stage('tier_experience_ner', track_memory=False):
+                if doc is None:
+                    exp_text = text
+                    if sections.has('experience') and len(sections.text_lower) == len(text):
+                        section_start, section_end = sections.offsets['experience']
+                        exp_text = text[section_start:section_end]
+                    doc = get_nlp()(exp_text)
+                
+                companies = set()
+                for ent in doc.ents:
+                    if ent.label_ == "ORG":
+                        companies.add(ent.text)
             
             for company in list(companies)[:5]:
                 experience.append({
@@ -192,17 +569,16 @@ class ResumeParser:
         
         return experience if experience else [{'company': 'Not Found', 'designation': '', 'duration': ''}]
     
-    def extract_education(self, text, doc):
+    def extract_education(self, text, doc, sections=None):
         """Extract education details"""
         education = []
+        sections = sections or self.index_sections(text)
+        edu_text = sections.get('education')
         
         # Look for education keywords
-        edu_keywords = ['degree', 'bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'bsc', 'msc', 'university', 'college']
-        text_lower = text.lower()
-        
-        for keyword in edu_keywords:
-            if keyword in text_lower:
-                edu_section = re.findall(rf'{keyword}[^.]*\.', text_lower)
+        for keyword, pattern in self.EDUCATION_PATTERNS:
+            if keyword in edu_text:
+                edu_section = pattern.findall(edu_text)
                 for section in edu_section[:3]:
                     education.append({
                         'degree': keyword.upper(),
@@ -214,34 +590,32 @@ class ResumeParser:
         
         return education if education else [{'degree': 'Not Found', 'field': '', 'institution': '', 'year': ''}]
     
-    def extract_certifications(self, text, doc):
+    def extract_certifications(self, text, doc, sections=None):
         """Extract certifications"""
-        certifications = []
-        
-        cert_keywords = ['certification', 'certified', 'aws', 'azure', 'gcp', 'cisco', 'comptia', 'pmp', 'prince2']
-        text_lower = text.lower()
+        sections = sections or self.index_sections(text)
+        found = set(self.CERTIFICATION_PATTERN.findall(sections.get('certifications')))
         
-        for keyword in cert_keywords:
-            if keyword in text_lower:
+        certifications = []
+        for keyword in self.CERTIFICATION_KEYWORDS:
+            if keyword in found:
                 certifications.append({
                     'name': keyword.upper(),
                     'issuer': 'Not extracted',
                     'year': 'Not extracted'
                 })
         
-        return certifications if certifications else []
+        return certifications
     
-    def extract_projects(self, text, doc):
+    def extract_projects(self, text, doc, sections=None):
         """Extract projects"""
         projects = []
+        sections = sections or self.index_sections(text)
+        proj_text = sections.get('projects')
         
         # Look for project keywords
-        proj_keywords = ['project', 'built', 'developed', 'created', 'implemented']
-        text_lower = text.lower()
-        
-        for keyword in proj_keywords:
-            if keyword in text_lower:
-                proj_section = re.findall(rf'{keyword}[^.]*\.', text_lower)
+        for keyword, pattern in self.PROJECT_PATTERNS:
+            if keyword in proj_text:
+                proj_section = pattern.findall(proj_text)
                 for section in proj_section[:3]:
                     projects.append({
                         'name': section.strip()[:100],
@@ -250,7 +624,7 @@ class ResumeParser:
                     })
                 break
         
-        return projects if projects else []
+        return projects
     
     def calculate_resume_score(self, data):
         """Calculate overall resume score (0-100)"""
@@ -287,12 +661,12 @@ class ResumeParser:
         
         return min(100, score)
     
-    def extract_keyword_insights(self, text):
+    def extract_keyword_insights(self, text, sections=None):
         """Extract important keywords from resume"""
-        text_lower = text.lower()
+        sections = sections or self.index_sections(text)
         
         # Remove stopwords and punctuation
-        words = text_lower.split()
+        words = sections.text_lower.split()
         keywords = [
             word.strip(string.punctuation) 
             for word in words 
@@ -315,3 +689,77 @@ def parse_resume_file(file_path):
     """Helper function to parse resume"""
     parser = ResumeParser()
     return parser.parse_resume(file_path)
+
+
+def parse_uploaded_resume(uploaded_file):
+    """
+    Parse an uploaded resume without writing it to disk
+    
+    Uploads larger than IN_MEMORY_PARSE_LIMIT are spooled to a temporary
+    file. Results of earlier uploads are cached by main.parse_cache.
+    """
+    suffix = Path(uploaded_file.name).suffix.lower()
+    
+    parser = ResumeParser(parallel_pages=getattr(settings, 'RESUME_PARSE_PARALLEL_PAGES', False))
+    if uploaded_file.size <= IN_MEMORY_PARSE_LIMIT:
+        # The upload is already in memory, parse it without another copy
+        return parser.parse_resume(uploaded_file, file_type=suffix.lstrip('.'))
+    
+    # Spool unusually large files to disk
+    with tempfile.SpooledTemporaryFile(max_size=IN_MEMORY_PARSE_LIMIT) as spooled_file:
+        for chunk in uploaded_file.chunks():
+            spooled_file.write(chunk)
+        return parser.parse_resume(spooled_file, file_type=suffix.lstrip('.'))
+
+
+def _parse_resume_chunk(file_paths, batch_size):
+    """
+    Parse a chunk of resumes inside one worker process
+    
+    Text is extracted for every file first, then all texts go through
+    spaCy together with nlp.pipe so the model runs batched.
+    """
+    parser = ResumeParser()
+    results = []
+    extracted = []
+    
+    for file_path in file_paths:
+        text, file_type = parser.extract_text(file_path)
+        if text:
+            extracted.append((file_path, text, file_type))
+        else:
+            results.append((file_path, None))
+    
+    docs = get_nlp().pipe((text for _, text, _ in extracted), batch_size=batch_size)
+    for (file_path, text, file_type), doc in zip(extracted, docs):
+        results.append((file_path, parser.build_parsed_data(text, file_type, doc)))
+    
+    return results
+
+
+def parse_resumes_batch(file_paths, n_workers=None, batch_size=32):
+    """
+    Parse many resumes using a process pool and spaCy's nlp.pipe
+    
+    Args:
+        file_paths: Iterable of PDF/DOCX file paths
+        n_workers: Number of worker processes (defaults to CPU count)
+        batch_size: Number of resumes per worker task and nlp.pipe batch
+    
+    Yields:
+        Tuples of (file_path, parsed_data) as each batch finishes.
+        parsed_data is None for files that could not be parsed.
+    """
+    file_paths = list(file_paths)
+    n_workers = n_workers or os.cpu_count() or 1
+    chunks = [file_paths[i:i + batch_size] for i in range(0, len(file_paths), batch_size)]
+    
+    if n_workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from _parse_resume_chunk(chunk, batch_size)
+        return
+    
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(_parse_resume_chunk, chunk, batch_size) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
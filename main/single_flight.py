@@ -0,0 +1,60 @@
+"""
+Single-flight Request Coalescing
+Makes concurrent callers asking for the same key share one in-flight call
+"""
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time within a process
+
+    The first caller for a key (the leader) runs the function. Callers that
+    arrive while it is running wait for and share its result or exception,
+    and are counted as coalesced_local. The function records whether it
+    went upstream or was served by another process, so the coalescing rate
+    can be reported.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.stats = {'upstream': 0, 'coalesced_local': 0, 'coalesced_remote': 0}
+
+    def do(self, key, func):
+        with self.lock:
+            call = self.calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self.calls[key] = Future()
+
+        if not is_leader:
+            self.record('coalesced_local')
+            return call.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+    def record(self, outcome):
+        """Count one call outcome: upstream, coalesced_local or coalesced_remote"""
+        with self.lock:
+            self.stats[outcome] += 1
+
+    def get_stats(self):
+        """Return outcome counts and the share of calls that were coalesced"""
+        with self.lock:
+            stats = dict(self.stats)
+        total = sum(stats.values())
+        coalesced = stats['coalesced_local'] + stats['coalesced_remote']
+        stats['coalescing_rate'] = coalesced / total if total else 0.0
+        return stats
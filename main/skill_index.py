@@ -0,0 +1,103 @@
+"""
+Job Skill Index
+Extracts known skills from each job once, when it is fetched, and finds
+the jobs sharing a skill with a resume through an inverted index from skill
+to jobs
+"""
+import re
+from collections import defaultdict
+
+from main.services import ResumeParser
+
+# Same taxonomy and word boundaries as resume skill extraction
+JOB_SKILL_MATCHER = ResumeParser.SKILL_MATCHER
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Keys added to a job dict by extract_job_terms
+TERM_KEYS = ('skills', 'title_skills', 'skill_counts', 'length')
+
+
+def extract_job_terms(job):
+    """
+    Term statistics of a job, computed once when it is fetched
+
+    Returns:
+        Dict of skills (in the title, description or company) and
+        title_skills as sorted lists, skill_counts (mentions per skill)
+        and length (words in the same text)
+    """
+    title = (job.get('title') or '').lower()
+    text = ' '.join((job.get('description') or '', title, job.get('company') or '')).lower()
+    skill_counts = JOB_SKILL_MATCHER.count(text)
+    return {
+        'skills': sorted(skill_counts),
+        'title_skills': sorted(JOB_SKILL_MATCHER.find(title)),
+        'skill_counts': dict(skill_counts),
+        'length': len(WORD_PATTERN.findall(text)),
+    }
+
+
+def extract_job_skills(job):
+    """
+    Find the known skills mentioned by a job
+
+    Returns:
+        Tuple of (skills in title, description or company, skills in title),
+        both sorted
+    """
+    terms = extract_job_terms(job)
+    return terms['skills'], terms['title_skills']
+
+
+def job_terms(job):
+    """Term statistics stored on a job dict at fetch time, or extracted now if missing"""
+    if all(key in job for key in TERM_KEYS):
+        return {key: job[key] for key in TERM_KEYS}
+    return extract_job_terms(job)
+
+
+def job_skills(job):
+    """Skills stored on a job dict at fetch time, or extracted now if missing"""
+    if 'skills' in job and 'title_skills' in job:
+        return job['skills'], job['title_skills']
+    return extract_job_skills(job)
+
+
+class SkillIndex:
+    """
+    In-memory inverted index from skill name to job positions
+
+    Finding a resume's candidate jobs only walks the posting lists of its own
+    skills, instead of searching every job's text for every skill.
+    """
+
+    def __init__(self, jobs=()):
+        self.jobs = []
+        self.job_skill_sets = []
+        self.postings = defaultdict(list)
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job):
+        position = len(self.jobs)
+        self.jobs.append(job)
+
+        skills, _ = job_skills(job)
+        self.job_skill_sets.append(frozenset(skills))
+        for skill in skills:
+            self.postings[skill].append(position)
+
+    def candidates(self, resume_skills):
+        """Positions of the jobs sharing at least one skill with a resume, in index order"""
+        skill_names = {skill.get('name', '').lower() for skill in resume_skills}
+
+        positions = set()
+        for skill_name in skill_names:
+            positions.update(self.postings.get(skill_name, ()))
+        return sorted(positions)
+
+    def matching_skills(self, position, resume_skills):
+        """Resume skill names found in the job at a position, sorted"""
+        skill_names = {skill.get('name', '').lower() for skill in resume_skills}
+        return sorted(self.job_skill_sets[position] & skill_names)
@@ -0,0 +1,80 @@
+"""
+Skill Matching Service
+Finds and counts every skill from a taxonomy in a single pass over the text
+"""
+import re
+from collections import Counter
+
+
+# Characters that may not touch a skill on either side, so "go" does not
+# match inside "google" and "c" does not match inside "c++"
+SKILL_BOUNDARY = r'a-z0-9_+#'
+
+
+def _build_trie(words):
+    """Build a character trie as nested dicts, '' marks the end of a word"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+
+def _trie_to_pattern(node):
+    """
+    Convert a trie into a regex so shared prefixes are only tested once
+
+    Optional groups are greedy, so the longest skill at a position is tried
+    first and shorter ones are only used if the boundary check fails.
+    """
+    is_end = '' in node
+    branches = [re.escape(char) + _trie_to_pattern(child)
+                for char, child in sorted(node.items()) if char != '']
+
+    if not branches:
+        return ''
+
+    if len(branches) == 1:
+        pattern = branches[0]
+    else:
+        pattern = '(?:' + '|'.join(branches) + ')'
+
+    if is_end:
+        if len(branches) == 1 and len(branches[0]) == 1:
+            return pattern + '?'
+        return '(?:' + pattern + ')?'
+    return pattern
+
+
+class SkillMatcher:
+    """Compiled multi-pattern matcher over a skill taxonomy"""
+
+    def __init__(self, taxonomy):
+        """
+        Args:
+            taxonomy: Dict of category -> list of skill names
+        """
+        self.categories = {}
+        for category, skills in taxonomy.items():
+            for skill in skills:
+                self.categories.setdefault(skill.lower(), category)
+
+        pattern = _trie_to_pattern(_build_trie(self.categories)) or '(?!)'
+        self.pattern = re.compile(
+            rf'(?<![{SKILL_BOUNDARY}])({pattern})(?![{SKILL_BOUNDARY}])'
+        )
+
+    def count(self, text_lower):
+        """
+        Count every skill occurrence in already lowercased text
+
+        Returns:
+            Counter of skill name -> number of occurrences
+        """
+        return Counter(self.pattern.findall(text_lower))
+
+    def find(self, text_lower):
+        """Return the set of skills present in lowercased text"""
+        return set(self.pattern.findall(text_lower))
@@ -1,3 +1,739 @@
-from django.test import TestCase
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
+import requests
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from docx import Document
+
+from benchmarks.synthetic_pdf import build_pdf
+from main.batch_scoring import BatchScorer
+from main.job_api import JobSearchAPI, TokenBucket
+from main.job_cache import canonical_query, canonical_top_skills, page_cache_key
+from main.job_index import search_local_jobs, upsert_jobs
+from main.models import JobResult, Resume, ResumeParseCacheEntry, ResumeParseJob
+from main.parse_cache import cache_parse, clear_cached_parses, get_cached_parse, resume_parse_cache_key
+from main.parse_metrics import StageTimer
+from main.parse_queue import claim_next_job, complete_job
+from main.ranking import BM25Ranker, CorpusStats, RankedJobs
+from main.recommendation_cache import CachedRecommendations, get_cached_recommendations, recommendation_cache_key
+from main.services import (
+    IN_MEMORY_PARSE_LIMIT, PARSER_VERSION, ResumeParser, ResumeSections, get_page_pool, parse_uploaded_resume,
+)
+from main.skill_index import extract_job_terms
+from main.skill_matcher import SkillMatcher
+
+
+class SkillMatcherTests(TestCase):
+    """Skills only match as whole words"""
+
+    def setUp(self):
+        self.matcher = SkillMatcher({
+            'programming': ['go', 'c', 'c++'],
+            'database': ['sql', 'mysql'],
+        })
+
+    def test_short_skill_does_not_match_inside_word(self):
+        self.assertEqual(self.matcher.find('worked at google on search'), set())
+
+    def test_skill_does_not_match_inside_longer_skill(self):
+        self.assertEqual(self.matcher.find('tuned mysql indexes'), {'mysql'})
+
+    def test_symbols_are_part_of_the_skill(self):
+        self.assertEqual(self.matcher.find('wrote c++ and go services'), {'c++', 'go'})
+
+    def test_counts_every_occurrence(self):
+        counts = self.matcher.count('sql, more sql and mysql')
+        self.assertEqual(counts['sql'], 2)
+        self.assertEqual(counts['mysql'], 1)
+
+
+def make_job(job_id, title, description, job_type='FULLTIME'):
+    job = {
+        'job_id': job_id,
+        'title': title,
+        'company': 'Acme',
+        'location': 'Pune, India',
+        'job_type': job_type,
+        'description': description,
+        'apply_link': f'https://jobs.example.com/{job_id}',
+    }
+    job.update(extract_job_terms(job))
+    return job
+
+
+class UpsertJobsTests(TestCase):
+    """Fetched jobs are only rewritten when their content changed"""
+
+    def test_unchanged_jobs_are_skipped(self):
+        job = make_job('job-1', 'Python Developer', 'Python and Django services')
+        self.assertEqual(upsert_jobs([job]), 1)
+        self.assertEqual(upsert_jobs([job]), 0)
+
+        job['description'] = 'Python, Django and Docker services'
+        self.assertEqual(upsert_jobs([job]), 1)
+        self.assertEqual(JobResult.objects.count(), 1)
+
+    def test_oversized_fields_are_truncated(self):
+        job = make_job('job-2', 'Python ' * 100, 'Python')
+        upsert_jobs([job])
+        self.assertEqual(len(JobResult.objects.get(job_id='job-2').title), 300)
+
+    def test_unchanged_jobs_stay_searchable(self):
+        job = make_job('job-3', 'Python Developer', 'Python and Django services')
+        upsert_jobs([job])
+        two_days_ago = timezone.now() - timedelta(days=2)
+        JobResult.objects.update(updated_at=two_days_ago, last_seen_at=two_days_ago)
+        self.assertEqual(search_local_jobs('django OR python'), [])
+
+        self.assertEqual(upsert_jobs([job]), 0)
+        self.assertEqual([found['job_id'] for found in search_local_jobs('django OR python')], ['job-3'])
+
+    def test_skill_sets_rank_jobs_by_matching_skills(self):
+        upsert_jobs([
+            make_job('one-skill', 'Python Developer', 'Python services'),
+            make_job('two-skills', 'Backend Developer', 'Python and Django services'),
+            make_job('google', 'Engineer at Google', 'Search infrastructure at Google'),
+        ])
+        found = [job['job_id'] for job in search_local_jobs('django OR python')]
+        self.assertEqual(found, ['two-skills', 'one-skill'])
+        self.assertEqual(search_local_jobs('go'), [])
+
+
+class ResumeParseCacheTests(TestCase):
+    """Re-uploads of the same file reuse the earlier parse"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('cache-test', password='unused-password')
+
+    def upload(self, content, name='resume.pdf'):
+        return ContentFile(content, name=name)
+
+    def test_identical_upload_hits(self):
+        self.assertIsNone(get_cached_parse(self.user, self.upload(b'first')))
+        cache_parse(self.user, self.upload(b'first'), {'full_name': 'Jane Doe', 'parse_metrics': {}})
+
+        self.assertEqual(get_cached_parse(self.user, self.upload(b'first')), {'full_name': 'Jane Doe'})
+        self.assertIsNone(get_cached_parse(self.user, self.upload(b'changed')))
+        self.assertIsNone(get_cached_parse(self.user, self.upload(b'first', name='resume.docx')))
+
+    def test_entries_belong_to_their_uploader(self):
+        other = User.objects.create_user('cache-other', password='unused-password')
+        cache_parse(self.user, self.upload(b'first'), {'full_name': 'Jane Doe'})
+        self.assertIsNone(get_cached_parse(other, self.upload(b'first')))
+
+        clear_cached_parses(self.user)
+        self.assertIsNone(get_cached_parse(self.user, self.upload(b'first')))
+
+    def test_completed_job_is_cached(self):
+        job = ResumeParseJob.objects.create(user=self.user, file_name='resume.pdf', file_data=b'first')
+        complete_job(ResumeParseJob.objects.get(pk=job.pk), parsed_data={'full_name': 'Jane Doe'})
+        self.assertEqual(get_cached_parse(self.user, self.upload(b'first')), {'full_name': 'Jane Doe'})
+
+    @override_settings(RESUME_PARSE_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entry_is_evicted(self):
+        cache_parse(self.user, self.upload(b'first'), {'full_name': 'First'})
+        cache_parse(self.user, self.upload(b'second'), {'full_name': 'Second'})
+        ResumeParseCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(minutes=1))
+
+        # Using the first entry makes the second the least recently used
+        get_cached_parse(self.user, self.upload(b'first'))
+        cache_parse(self.user, self.upload(b'third'), {'full_name': 'Third'})
+
+        self.assertIsNotNone(get_cached_parse(self.user, self.upload(b'first')))
+        self.assertIsNone(get_cached_parse(self.user, self.upload(b'second')))
+        self.assertIsNotNone(get_cached_parse(self.user, self.upload(b'third')))
+
+    @override_settings(RESUME_PARSE_CACHE_TIMEOUT=60)
+    def test_unused_entries_expire(self):
+        cache_parse(self.user, self.upload(b'first'), {'full_name': 'Jane Doe'})
+        ResumeParseCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(minutes=2))
+        self.assertIsNone(get_cached_parse(self.user, self.upload(b'first')))
+
+
+class ClaimNextJobTests(TestCase):
+    """Each pending job is claimed by one worker only"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('worker-test', password='unused-password')
+
+    def create_job(self, name):
+        return ResumeParseJob.objects.create(user=self.user, file_name=name, file_data=b'data')
+
+    def test_claims_each_job_once(self):
+        first = self.create_job('first.pdf')
+        second = self.create_job('second.pdf')
+
+        claimed = [claim_next_job(), claim_next_job()]
+        self.assertEqual({job.pk for job in claimed}, {first.pk, second.pk})
+        self.assertIsNone(claim_next_job())
+        self.assertEqual(ResumeParseJob.objects.filter(status='processing').count(), 2)
+
+    def test_skips_job_claimed_by_another_worker(self):
+        taken = self.create_job('taken.pdf')
+        waiting = self.create_job('waiting.pdf')
+        ResumeParseJob.objects.filter(pk=taken.pk).update(status='processing')
+
+        self.assertEqual(claim_next_job().pk, waiting.pk)
+        self.assertIsNone(claim_next_job())
+
+
+class HeaderNameTests(TestCase):
+    """Names are read from the header before any NER runs"""
+
+    def setUp(self):
+        self.parser = ResumeParser(metrics_sample_rate=0)
+
+    def test_title_line_is_not_a_name(self):
+        header = 'SOFTWARE ENGINEER\nJANE DOE\njane.doe@example.com'
+        self.assertEqual(self.parser.name_from_header(header), 'Jane Doe')
+
+    def test_headings_are_not_names(self):
+        header = 'Curriculum Vitae\nProfessional Summary\nJohn Smith'
+        self.assertEqual(self.parser.name_from_header(header), 'John Smith')
+
+    def test_header_rules_skip_ner(self):
+        timer = StageTimer(enabled=True)
+        text = 'Senior Data Analyst\nMaria Garcia\nmaria@example.com\n\nExperience\nAnalyst at Acme'
+        self.assertEqual(self.parser.extract_name(text, timer=timer), 'Maria Garcia')
+        self.assertEqual(list(timer.stages), ['tier_header_rules'])
+
+
+class ParallelPdfExtractionTests(TestCase):
+    """Parallel extraction keeps the serial budgets and survives a dead worker"""
+
+    def setUp(self):
+        self.pdf = build_pdf([[f'Page {number} Python Django'] for number in range(40)])
+
+    def parsers(self, **options):
+        serial = ResumeParser(max_pages=200, metrics_sample_rate=0, **options)
+        parallel = ResumeParser(parallel_pages=True, n_workers=2, metrics_sample_rate=0, **options)
+        return serial, parallel
+
+    def test_char_budget_matches_serial(self):
+        serial, parallel = self.parsers(max_chars=200)
+        text = parallel.extract_text_from_pdf(self.pdf)
+        self.assertEqual(text, serial.extract_text_from_pdf(self.pdf))
+        self.assertLessEqual(len(text.replace('\n', '')), 200)
+
+    def test_stops_after_empty_pages(self):
+        pdf = build_pdf([['Page 0 Python']] + [[] for _ in range(ResumeParser.MAX_EMPTY_PAGES)] + [['Page 4 Django']] * 30)
+        serial, parallel = self.parsers()
+        text = parallel.extract_text_from_pdf(pdf)
+        self.assertEqual(text, serial.extract_text_from_pdf(pdf))
+        self.assertNotIn('Django', text)
+
+    def test_broken_pool_is_replaced(self):
+        _, parallel = self.parsers()
+        pool = get_page_pool(2)
+        # A worker exiting abruptly breaks the whole pool
+        with self.assertRaises(BrokenProcessPool):
+            pool.submit(os._exit, 1).result()
+
+        self.assertIn('Page 39', parallel.extract_text_from_pdf(self.pdf))
+        self.assertIsNot(get_page_pool(2), pool)
+        self.assertIn('Page 39', parallel.extract_text_from_pdf(self.pdf))
+
+
+class RankedJobsTests(TestCase):
+    """Lazy slices agree with a full sort of the same scores"""
+
+    def setUp(self):
+        skills = ['python', 'django', 'docker', 'aws', 'react', 'sql']
+        self.jobs = [
+            make_job(
+                f'job-{index}',
+                f'{skills[index % 6].title()} Engineer',
+                ' '.join(skills[(index + offset) % 6] for offset in range(index % 4 + 1)) + ' team',
+                job_type='FULLTIME' if index % 2 else 'CONTRACTOR',
+            )
+            for index in range(30)
+        ]
+        self.resume_skills = [
+            {'name': 'PYTHON', 'proficiency': 'Advanced'},
+            {'name': 'DOCKER', 'proficiency': 'Beginner'},
+            {'name': 'SQL', 'proficiency': 'Intermediate'},
+        ]
+        self.stats = CorpusStats.from_jobs(self.jobs)
+
+    def full_sort(self, job_type=None):
+        ranker = BM25Ranker(self.stats)
+        weights = ranker.query_weights(self.resume_skills)
+        scored = []
+        for position, job in enumerate(self.jobs):
+            if job_type and job['job_type'] != job_type:
+                continue
+            relevance, _ = ranker.relevance(job, weights)
+            if ranker.matching_skills(job, weights):
+                scored.append((-relevance, position))
+        return [self.jobs[position]['job_id'] for _, position in sorted(scored)]
+
+    def test_slices_match_full_sort(self):
+        ranked = RankedJobs(self.jobs, self.resume_skills, stats=self.stats)
+        expected = self.full_sort()
+
+        self.assertEqual(len(ranked), len(expected))
+        self.assertEqual([job['job_id'] for job in ranked[:5]], expected[:5])
+        self.assertEqual([job['job_id'] for job in ranked[5:10]], expected[5:10])
+        self.assertEqual(ranked[-1]['job_id'], expected[-1])
+
+    def test_candidates_share_a_skill(self):
+        ranked = RankedJobs(self.jobs, self.resume_skills, stats=self.stats)
+        candidates = {job['job_id'] for job in ranked}
+        expected = {job['job_id'] for job in self.jobs if {'python', 'docker', 'sql'} & set(job['skills'])}
+        self.assertEqual(candidates, expected)
+
+    def test_filter_keeps_order(self):
+        ranked = RankedJobs(self.jobs, self.resume_skills, stats=self.stats).filter(job_type='FULLTIME')
+        self.assertEqual([job['job_id'] for job in ranked], self.full_sort(job_type='FULLTIME'))
+
+
+class BatchScorerTests(TestCase):
+    """Batch scores are the BM25 relevance RankedJobs computes per resume"""
+
+    def test_top_k_matches_ranked_jobs(self):
+        skills = ['python', 'django', 'docker', 'aws', 'react', 'sql']
+        jobs = [
+            make_job(f'job-{index}', f'{skills[index % 6].title()} Engineer',
+                     ' '.join(skills[(index * 5 + offset) % 6] for offset in range(index % 5 + 1)))
+            for index in range(40)
+        ]
+        resumes = [
+            [{'name': 'PYTHON', 'proficiency': 'Expert'}, {'name': 'AWS', 'proficiency': 'Beginner'}],
+            [{'name': 'React', 'proficiency': 'Intermediate'}],
+            [{'name': 'COBOL', 'proficiency': 'Advanced'}],
+        ]
+        scorer = BatchScorer.from_jobs(jobs)
+
+        # Which of the jobs tied at the K-th score are kept is arbitrary,
+        # so only the relevance at each rank is compared
+        for resume_skills, ranked in zip(resumes, scorer.top_k(resumes, k=10)):
+            expected = RankedJobs(jobs, resume_skills, stats=scorer.ranker.stats).entries(10)
+            self.assertEqual(len(ranked), len(expected))
+            for (_, relevance), (_, expected_relevance, _) in zip(ranked, expected):
+                self.assertAlmostEqual(relevance, expected_relevance, places=4)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """JSearch stand-in answering with the next queued (status, headers), then 200"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.request_count += 1
+        page = parse_qs(urlparse(self.path).query).get('page', ['1'])[0]
+        status, headers = self.server.responses.pop(0) if self.server.responses else (200, {})
+        if status == 200:
+            payload = {'data': [{
+                'job_id': f'standin-page{page}-{self.server.request_count}',
+                'job_title': 'Python Developer',
+                'employer_name': 'Acme',
+                'job_description': 'Python and Django services',
+            }]}
+        else:
+            payload = {'message': 'Unavailable'}
+        body = json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServerMixin:
+    """Points a JobSearchAPI at a local stand-in server with an empty cache"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        self.server.request_count = 0
+        self.server.responses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.api = JobSearchAPI('test-key')
+        self.api.BASE_URL = f'http://127.0.0.1:{self.server.server_port}/search'
+        cache.clear()
+
+
+class StandInTestCase(StandInServerMixin, TestCase):
+    pass
+
+
+class FetchLockTests(StandInTestCase):
+    """Only the caller that added a page's fetch lock removes it"""
+
+    def lock_key(self):
+        return f"{page_cache_key('python', 1, None)}_lock"
+
+    def test_owner_releases_its_lock(self):
+        jobs = self.api._fetch_page_locked('python', 1, None)
+        self.assertEqual(len(jobs), 1)
+        self.assertIsNone(cache.get(self.lock_key()))
+
+    def test_waiter_leaves_another_callers_lock(self):
+        cache.set(self.lock_key(), 'other-token', 60)
+        self.api.FETCH_LOCK_TIMEOUT = 0.3
+
+        jobs = self.api._fetch_page_locked('python', 1, None)
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(cache.get(self.lock_key()), 'other-token')
+
+
+class ResumeUploadCacheTests(TestCase):
+    """Uploads of an already parsed file skip the parser"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('upload-test', password='unused-password')
+        self.client.force_login(self.user)
+
+    def post(self, content, name='resume.pdf'):
+        return self.client.post(reverse('upload_resume'), {'resume': SimpleUploadedFile(name, content)})
+
+    def test_key_follows_contents_type_and_parser_version(self):
+        key, content_hash = resume_parse_cache_key(ContentFile(b'same bytes', name='first.pdf'))
+        self.assertEqual(resume_parse_cache_key(ContentFile(b'same bytes', name='second.pdf'))[0], key)
+        self.assertNotEqual(resume_parse_cache_key(ContentFile(b'other bytes', name='first.pdf'))[0], key)
+        self.assertIn(PARSER_VERSION, key)
+        self.assertIn(content_hash, key)
+
+    def test_new_file_is_queued(self):
+        response = self.post(b'%PDF-new file')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(ResumeParseJob.objects.filter(user=self.user).count(), 1)
+        self.assertFalse(Resume.objects.filter(user=self.user).exists())
+
+    def test_repeat_upload_is_saved_from_the_cache(self):
+        parsed_data = {'full_name': 'Jane Doe', 'skills': [{'name': 'PYTHON', 'proficiency': 'Advanced'}]}
+        cache_parse(self.user, ContentFile(b'%PDF-parsed before', name='resume.pdf'), parsed_data)
+
+        response = self.post(b'%PDF-parsed before')
+        self.assertRedirects(response, reverse('resume_details'), fetch_redirect_response=False)
+        self.assertEqual(Resume.objects.get(user=self.user).full_name, 'Jane Doe')
+        self.assertFalse(ResumeParseJob.objects.exists())
+
+
+class PdfBudgetTests(TestCase):
+    """PDF text is read lazily within the page, character and empty-page budgets"""
+
+    def test_stops_at_page_budget(self):
+        pdf = build_pdf([[f'Page {number}'] for number in range(10)])
+        text = ResumeParser(max_pages=3, metrics_sample_rate=0).extract_text_from_pdf(pdf)
+        self.assertEqual(text.split(), ['Page', '0', 'Page', '1', 'Page', '2'])
+
+    def test_stops_at_char_budget(self):
+        pdf = build_pdf([['x' * 50] for _ in range(10)])
+        parser = ResumeParser(max_chars=120, metrics_sample_rate=0)
+        pages = list(parser.iter_pdf_pages(pdf))
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(sum(len(page) for page in pages), 120)
+
+    def test_gives_up_after_empty_pages(self):
+        pdf = build_pdf([['Page 0']] + [[] for _ in range(ResumeParser.MAX_EMPTY_PAGES)] + [['Page 4']])
+        text = ResumeParser(metrics_sample_rate=0).extract_text_from_pdf(pdf)
+        self.assertEqual(text.strip(), 'Page 0')
+
+    def test_pages_are_read_lazily(self):
+        pdf = build_pdf([[f'Page {number}'] for number in range(10)])
+        pages = ResumeParser(metrics_sample_rate=0).iter_pdf_pages(pdf)
+        self.assertEqual(next(pages).strip(), 'Page 0')
+        pages.close()
+
+
+SECTIONED_RESUME = """Jane Doe
+jane@example.com
+
+Experience
+Built Django services at Acme.
+
+Education:
+Bachelor of Engineering from Pune University.
+
+Certifications
+AWS Certified Developer
+"""
+
+
+class ResumeSectionsTests(TestCase):
+    """The resume is segmented once and every extractor reads the same index"""
+
+    def setUp(self):
+        self.sections = ResumeSections(SECTIONED_RESUME, ResumeParser.SECTION_PATTERN)
+
+    def test_sections_run_to_the_next_heading(self):
+        self.assertEqual(self.sections.get('experience').strip(), 'built django services at acme.')
+        self.assertEqual(self.sections.get('certifications').strip(), 'aws certified developer')
+        self.assertIn('bachelor', self.sections.get('education'))
+        self.assertNotIn('aws', self.sections.get('education'))
+
+    def test_missing_section_falls_back_to_the_whole_text(self):
+        self.assertFalse(self.sections.has('projects'))
+        self.assertEqual(self.sections.get('projects'), SECTIONED_RESUME.lower())
+
+    def test_headings_only_count_as_whole_lines(self):
+        sections = ResumeSections('Skills in education technology\nPython', ResumeParser.SECTION_PATTERN)
+        self.assertFalse(sections.has('education'))
+        self.assertFalse(sections.has('skills'))
+
+    def test_extractors_read_their_section(self):
+        parser = ResumeParser(metrics_sample_rate=0)
+        certifications = parser.extract_certifications(SECTIONED_RESUME, None, self.sections)
+        self.assertEqual([certification['name'] for certification in certifications], ['CERTIFIED', 'AWS'])
+        education = parser.extract_education(SECTIONED_RESUME, None, self.sections)
+        self.assertEqual(education[0]['degree'], 'BACHELOR')
+
+
+def build_docx(lines):
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class ResumeSourceTests(TestCase):
+    """Resumes are read from paths, bytes and file-like objects alike"""
+
+    def setUp(self):
+        self.parser = ResumeParser(metrics_sample_rate=0)
+
+    def sources(self, content, suffix):
+        file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+        file.write(content)
+        file.close()
+        self.addCleanup(os.unlink, file.name)
+        return [file.name, content, memoryview(content), io.BytesIO(content), ContentFile(content, name=f'r{suffix}')]
+
+    def test_pdf_sources_give_the_same_text(self):
+        content = build_pdf([['Jane Doe', 'Python and Django developer']])
+        texts = {self.parser.extract_text(source, 'pdf')[0] for source in self.sources(content, '.pdf')}
+        self.assertEqual(len(texts), 1)
+        self.assertIn('Django', texts.pop())
+
+    def test_docx_sources_give_the_same_text(self):
+        content = build_docx(['Jane Doe', 'Python and Django developer'])
+        texts = {self.parser.extract_text(source, 'docx')[0] for source in self.sources(content, '.docx')}
+        self.assertEqual(texts, {'Jane Doe\nPython and Django developer'})
+
+    def test_file_type_comes_from_the_name(self):
+        content = build_docx(['Jane Doe'])
+        self.assertEqual(self.parser.extract_text(ContentFile(content, name='resume.docx'))[1], 'docx')
+
+    def test_uploads_over_the_memory_limit_still_parse(self):
+        lines = ['Jane Doe', 'Python and Django developer']
+        padding = 'x' * (IN_MEMORY_PARSE_LIMIT + 1)
+        upload = ContentFile(build_pdf([lines]) + padding.encode(), name='resume.pdf')
+        self.assertGreater(upload.size, IN_MEMORY_PARSE_LIMIT)
+        parsed_data = parse_uploaded_resume(upload)
+        self.assertEqual(parsed_data['file_type'], 'pdf')
+
+
+class TokenBucketTests(TestCase):
+    """Calls beyond the burst are paced at the bucket's rate"""
+
+    def test_burst_is_immediate(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_calls_past_the_burst_wait_for_tokens(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Two tokens up front, then one every 50 ms for the other four
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+
+class ConcurrentPageFetchTests(StandInTestCase):
+    """Missing pages are fetched upstream and merged with cached ones in page order"""
+
+    def test_pages_come_back_in_order(self):
+        jobs = self.api.search_jobs('python', num_pages=3)
+        self.assertEqual([job['job_id'].split('-')[1] for job in jobs], ['page1', 'page2', 'page3'])
+        self.assertEqual(self.server.request_count, 3)
+
+    def test_cached_pages_are_not_fetched(self):
+        cached_job = {'job_id': 'cached', 'title': 'Python Developer'}
+        cache.set(page_cache_key('python', 2, None), {'jobs': [cached_job], 'fetched_at': time.time()})
+
+        jobs = self.api.search_jobs('python', num_pages=3)
+        self.assertEqual(jobs[1]['job_id'], 'cached')
+        self.assertEqual(self.server.request_count, 2)
+
+
+class RetryTests(StandInTestCase):
+    """Throttled and failed requests are retried, honouring Retry-After"""
+
+    def response_with(self, **headers):
+        response = requests.Response()
+        response.headers.update(headers)
+        return response
+
+    def test_retries_until_success(self):
+        self.server.responses = [(503, {'Retry-After': '0'}), (429, {'Retry-After': '0'})]
+        jobs = self.api._fetch_page('python', 1, None)
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(self.server.request_count, 3)
+
+    def test_waits_for_retry_after(self):
+        self.server.responses = [(429, {'Retry-After': '0.3'})]
+        start = time.monotonic()
+        self.api._fetch_page('python', 1, None)
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+
+    def test_returns_last_error_after_max_retries(self):
+        self.api.MAX_RETRIES = 1
+        self.server.responses = [(500, {'Retry-After': '0'})] * 3
+        response = self.api._get_with_retries({'query': 'python', 'page': '1'})
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_retry_after_forms(self):
+        self.assertEqual(self.api._retry_after(self.response_with(**{'Retry-After': '2'})), 2)
+        self.assertEqual(self.api._retry_after(self.response_with(**{'Retry-After': '3600'})), self.api.MAX_BACKOFF)
+        self.assertIsNone(self.api._retry_after(self.response_with()))
+        self.assertIsNone(self.api._retry_after(self.response_with(**{'Retry-After': 'soon'})))
+
+        in_two_seconds = formatdate(time.time() + 2, usegmt=True)
+        delay = self.api._retry_after(self.response_with(**{'Retry-After': in_two_seconds}))
+        self.assertTrue(0 < delay <= 2)
+
+
+class StaleWhileRevalidateTests(StandInServerMixin, TransactionTestCase):
+    """Soft-expired pages are served at once and refreshed in the background"""
+
+    def cache_page(self, age):
+        cache.set(
+            page_cache_key('python', 1, None),
+            {'jobs': [{'job_id': 'cached', 'title': 'Python Developer'}], 'fetched_at': time.time() - age},
+        )
+
+    def cached_job_ids(self):
+        return [job['job_id'] for job in cache.get(page_cache_key('python', 1, None))['jobs']]
+
+    def test_fresh_page_is_served_from_cache(self):
+        self.cache_page(age=0)
+        self.assertEqual(self.api.search_jobs('python')[0]['job_id'], 'cached')
+        self.assertEqual(self.server.request_count, 0)
+
+    def test_soft_expired_page_is_served_then_refreshed(self):
+        self.cache_page(age=self.api.SOFT_TTL + 1)
+        self.assertEqual(self.api.search_jobs('python')[0]['job_id'], 'cached')
+
+        deadline = time.monotonic() + 5
+        while self.cached_job_ids() == ['cached'] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(self.cached_job_ids(), ['standin-page1-1'])
+
+    def test_hard_expired_page_is_refetched(self):
+        self.cache_page(age=self.api.HARD_TTL + 1)
+        self.assertEqual(self.api.search_jobs('python')[0]['job_id'], 'standin-page1-1')
+
+    def test_hard_expired_page_falls_back_to_stale_copy(self):
+        self.api.MAX_RETRIES = 0
+        self.server.responses = [(500, {})]
+        self.cache_page(age=self.api.HARD_TTL + 1)
+        self.assertEqual(self.api.search_jobs('python')[0]['job_id'], 'cached')
+
+
+class JobCacheKeyTests(TestCase):
+    """Equivalent searches share one cache key"""
+
+    def test_skill_order_and_aliases_give_the_same_key(self):
+        first = canonical_query('Python OR js OR Docker')
+        second = canonical_query('docker OR JavaScript OR python')
+        self.assertEqual(first, second)
+        self.assertEqual(page_cache_key(first, 1, ''), page_cache_key(second, 1, ''))
+
+    def test_pages_and_locations_get_their_own_keys(self):
+        query = canonical_query('python OR django')
+        self.assertNotEqual(page_cache_key(query, 1, ''), page_cache_key(query, 2, ''))
+        self.assertNotEqual(page_cache_key(query, 1, ''), page_cache_key(query, 1, 'pune'))
+
+    def test_top_skills_ignore_the_order_skills_were_found_in(self):
+        skills = [
+            {'name': name, 'proficiency': proficiency}
+            for name, proficiency in [
+                ('PYTHON', 'Beginner'), ('JS', 'Advanced'), ('DOCKER', 'Intermediate'),
+                ('AWS', 'Beginner'), ('GO', 'Beginner'), ('JAVA', 'Beginner'), ('JAVASCRIPT', 'Beginner'),
+            ]
+        ]
+        self.assertEqual(canonical_top_skills(skills), canonical_top_skills(list(reversed(skills))))
+        self.assertIn('javascript', canonical_top_skills(skills, limit=1))
+
+
+class RecommendationCacheKeyTests(TestCase):
+    """Recommendation keys follow the resume and the filters"""
+
+    def setUp(self):
+        user = User.objects.create_user('recommendation-test', password='unused-password')
+        self.resume = Resume.objects.create(user=user, skills=[{'name': 'PYTHON', 'proficiency': 'Beginner'}])
+
+    def test_key_is_stable(self):
+        self.assertEqual(recommendation_cache_key(self.resume), recommendation_cache_key(self.resume))
+
+    def test_key_changes_when_resume_is_saved(self):
+        before = recommendation_cache_key(self.resume)
+        self.resume.save()
+        self.assertNotEqual(recommendation_cache_key(self.resume), before)
+
+    def test_key_changes_with_filters(self):
+        key = recommendation_cache_key(self.resume)
+        self.assertNotEqual(recommendation_cache_key(self.resume, location='Pune'), key)
+        self.assertNotEqual(recommendation_cache_key(self.resume, job_type='FULLTIME'), key)
+        self.assertNotEqual(recommendation_cache_key(self.resume, min_score=50), key)
+
+
+class CachedRecommendationsTests(TestCase):
+    """A cached ranking pages through the same jobs as the ranking it came from"""
+
+    def setUp(self):
+        cache.clear()
+        skills = ['python', 'django', 'docker', 'sql']
+        upsert_jobs([
+            make_job(f'job-{index}', f'{skills[index % 4].title()} Developer',
+                     ' '.join(skills[(index + offset) % 4] for offset in range(index % 3 + 1)))
+            for index in range(40)
+        ])
+        user = User.objects.create_user('cached-test', password='unused-password')
+        self.resume = Resume.objects.create(user=user, skills=[
+            {'name': 'PYTHON', 'proficiency': 'Advanced'},
+            {'name': 'DJANGO', 'proficiency': 'Beginner'},
+        ])
+
+    def test_second_request_is_served_from_the_cache(self):
+        ranked = get_cached_recommendations(self.resume)
+        self.assertIsInstance(ranked, RankedJobs)
+        cached = get_cached_recommendations(self.resume)
+        self.assertIsInstance(cached, CachedRecommendations)
+
+        self.assertEqual(len(cached), len(ranked))
+        self.assertEqual([job['job_id'] for job in cached[:10]], [job['job_id'] for job in ranked[:10]])
+        self.assertEqual([job['match_score'] for job in cached[10:20]], [job['match_score'] for job in ranked[10:20]])
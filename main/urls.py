@@ -5,6 +5,7 @@ urlpatterns = [
     path('', views.home, name='home'),
     path('dashboard/', views.dashboard, name='dashboard'),
     path('upload-resume/', views.upload_resume, name='upload_resume'),
+    path('upload-resume/status/<int:job_id>/', views.resume_parse_status, name='resume_parse_status'),
     path('resume-details/', views.resume_details, name='resume_details'),
     path('resume-details/clear/', views.clear_resume, name='clear_resume'),
     path('job-recommendations/', views.job_recommendations, name='job_recommendations'),
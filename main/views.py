@@ -7,16 +7,15 @@ from django.views.decorators.http import require_http_methods
 from django.http import JsonResponse
 from django.db.models import Q
 from django.core.paginator import Paginator
+from django.urls import reverse
 
 from accounts.forms import UserRegistrationForm, UserLoginForm
-from main.models import Resume, Skill, JobResult, SavedJob, APIKey
+from main.models import Resume, Skill, JobResult, SavedJob, APIKey, ResumeParseJob
 from main.forms import ResumeUploadForm, JobSearchForm
-from main.services import parse_resume_file
-from main.job_api import get_recommended_jobs, search_jobs_by_keyword
-
-import os
-import tempfile
-from pathlib import Path
+from main.parse_queue import enqueue_resume, save_parsed_resume
+from main.parse_cache import clear_cached_parses, get_cached_parse
+from main.job_api import search_jobs_by_keyword
+from main.recommendation_cache import get_cached_recommendations
 
 
 @require_http_methods(["GET", "POST"])
@@ -119,57 +118,20 @@ def upload_resume(request):
     if request.method == 'POST':
         form = ResumeUploadForm(request.POST, request.FILES)
         if form.is_valid():
-            resume_file = request.FILES['resume']
+            uploaded_file = request.FILES['resume']
             
-            # Save file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(resume_file.name).suffix) as tmp_file:
-                for chunk in resume_file.chunks():
-                    tmp_file.write(chunk)
-                tmp_path = tmp_file.name
+            # A file parsed before is saved straight away
+            parsed_data = get_cached_parse(request.user, uploaded_file)
+            if parsed_data:
+                save_parsed_resume(request.user, parsed_data)
+                messages.success(request, 'Resume uploaded and parsed successfully!')
+                return redirect('resume_details')
             
-            try:
-                # Parse resume
-                parsed_data = parse_resume_file(tmp_path)
-                
-                if parsed_data:
-                    # Save or update resume in database
-                    resume, created = Resume.objects.get_or_create(user=request.user)
-                    
-                    resume.full_name = parsed_data.get('full_name', '')
-                    resume.email = parsed_data.get('email', '')
-                    resume.phone = parsed_data.get('phone', '')
-                    resume.skills = parsed_data.get('skills', [])
-                    resume.experience = parsed_data.get('experience', [])
-                    resume.education = parsed_data.get('education', [])
-                    resume.certifications = parsed_data.get('certifications', [])
-                    resume.projects = parsed_data.get('projects', [])
-                    resume.resume_score = parsed_data.get('resume_score', 0)
-                    resume.keyword_insights = parsed_data.get('keyword_insights', [])
-                    resume.file_type = parsed_data.get('file_type', '')
-                    resume.save()
-                    
-                    # Clear old skills
-                    Skill.objects.filter(resume=resume).delete()
-                    
-                    # Save skills
-                    for skill in parsed_data.get('skills', []):
-                        Skill.objects.create(
-                            resume=resume,
-                            name=skill.get('name', ''),
-                            proficiency=skill.get('proficiency', 'intermediate')
-                        )
-                    
-                    messages.success(request, 'Resume uploaded and parsed successfully!')
-                    return redirect('resume_details')
-                else:
-                    messages.error(request, 'Failed to parse resume. Please try again.')
+            # Queue the upload, run_parse_worker parses it in the background
+            job = enqueue_resume(request.user, uploaded_file)
             
-            finally:
-                # Delete temporary file
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            messages.info(request, 'Resume uploaded! We are parsing it now.')
+            return redirect(f"{reverse('upload_resume')}?job={job.pk}")
         else:
             for field, errors in form.errors.items():
                 for error in errors:
@@ -177,7 +139,28 @@ def upload_resume(request):
     else:
         form = ResumeUploadForm()
     
-    return render(request, 'main/upload_resume.html', {'form': form})
+    # Job the page should poll for after an upload
+    parse_job = None
+    job_id = request.GET.get('job')
+    if job_id and job_id.isdigit():
+        parse_job = ResumeParseJob.objects.filter(pk=job_id, user=request.user).first()
+    
+    return render(request, 'main/upload_resume.html', {'form': form, 'parse_job': parse_job})
+
+
+@login_required(login_url='login')
+@require_http_methods(["GET"])
+def resume_parse_status(request, job_id):
+    """Report the status of a queued resume parse as JSON"""
+    job = get_object_or_404(ResumeParseJob, pk=job_id, user=request.user)
+    
+    data = {'success': job.status != 'failed', 'status': job.status}
+    if job.status == 'done':
+        data['redirect'] = reverse('resume_details')
+    elif job.status == 'failed':
+        data['message'] = job.error
+    
+    return JsonResponse(data)
 
 
 @login_required(login_url='login')
@@ -214,6 +197,9 @@ def clear_resume(request):
         # Delete the resume
         resume.delete()
         
+        # Cached parses hold the same personal details
+        clear_cached_parses(request.user)
+        
         messages.success(request, f'{resume_name} has been cleared successfully. You can upload a new resume anytime.')
     except Resume.DoesNotExist:
         messages.error(request, 'No resume found to clear.')
@@ -253,16 +239,17 @@ def job_recommendations(request):
             if keyword:
                 # Search by keyword
                 jobs = search_jobs_by_keyword(keyword, api_key, location)
+                
+                # Filter by match score
+                jobs = [job for job in jobs if job.get('match_score', 0) >= min_score]
+                
+                # Filter by job type
+                if job_type:
+                    jobs = [job for job in jobs if job.get('job_type', '').upper() == job_type]
             else:
-                # Get recommendations based on resume skills
-                jobs = get_recommended_jobs(resume.skills, api_key, location)
-            
-            # Filter by match score
-            jobs = [job for job in jobs if job.get('match_score', 0) >= min_score]
-            
-            # Filter by job type
-            if job_type:
-                jobs = [job for job in jobs if job.get('job_type', '').upper() == job_type]
+                # Get recommendations based on resume skills, ranked once
+                # and cached so later pages skip the search and scoring
+                jobs = get_cached_recommendations(resume, api_key, location, job_type, min_score)
             
             total_jobs = len(jobs)
         except Exception as e:
@@ -273,7 +260,7 @@ def job_recommendations(request):
     else:
         # Default: show recommendations based on resume skills
         try:
-            jobs = get_recommended_jobs(resume.skills, api_key)
+            jobs = get_cached_recommendations(resume, api_key)
             total_jobs = len(jobs)
         except Exception as e:
             error_msg = str(e)